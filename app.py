@@ -10,22 +10,39 @@ from together import Together
 import json
 import logging
 import shutil
+import functools
+import hashlib
+import weakref
 from dotenv import load_dotenv
 import os
 import re
-import requests
-import spacy
+import time
 import datetime
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
-from pydub import AudioSegment
-from moviepy.editor import *
-from typing import List, Dict, Any, Tuple, Callable, Optional
+from typing import List, Dict, Any, Tuple, Callable, Optional, AsyncIterator
+from contextlib import asynccontextmanager
 from abc import ABC, abstractmethod
-from groq import AsyncGroq
+from groq import AsyncGroq, APIConnectionError, RateLimitError, InternalServerError
 from tiktokvoice import tts
 
-nlp = spacy.load("en_core_web_md")
+@st.cache_resource
+def get_nlp():
+    """Loads the spaCy pipeline once per process, on first use."""
+    import spacy
+    # Only tags, lemmas and entities are used; the parser and word vectors are not
+    for model in SPACY_MODELS:
+        try:
+            nlp = spacy.load(model, exclude=["parser"])
+            break
+        except OSError:
+            logger.warning(f"spaCy model {model} is not installed")
+    else:
+        raise OSError(f"No spaCy English model found. Install one with: python -m spacy download {SPACY_MODELS[0]}")
+    # Run one tiny doc so lazy component setup isn't paid by the first real request
+    nlp("Warm up the pipeline.")
+    return nlp
 
 # Load environment variables
 load_dotenv()
@@ -50,6 +67,51 @@ FALLBACK_SCENE_BOX_COLOR = "black@0.5"
 FALLBACK_SCENE_BOX_BORDER_WIDTH = 5
 FALLBACK_SCENE_FONT_SIZE = 30
 FALLBACK_SCENE_FONT_FILE = "/tmp/qualitype/opentype/QTHelvet-Black.otf"
+# The small model is enough for tagging and lemmas; md is accepted for installs that predate the switch
+SPACY_MODELS = ["en_core_web_sm", "en_core_web_md"]
+# Lemma extraction only needs the tagger, attribute ruler and lemmatizer
+LEMMA_DISABLED_PIPES = ["parser", "ner"]
+IMAGE_GENERATION_CONCURRENCY = 4
+TTS_CONCURRENCY = 8
+TTS_VOICE = "en_uk_003"
+TTS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "shorts", "tts")
+# A voice's rendering of a given text does not change, so cached voiceovers never expire
+TTS_CACHE_TTL = float('inf')
+IMAGE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "shorts", "img")
+LLM_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "shorts", "llm")
+LLM_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days, in seconds
+AGENT_CACHE_DIR = os.path.join(os.getcwd(), ".agent_cache")
+AGENT_CACHE_TTL = 24 * 60 * 60  # Research covers recent events, so agent outputs go stale within a day
+RETRY_ATTEMPTS = 4
+RETRY_MAX_DELAY = 30
+HTTP_CONNECTION_LIMIT = 32
+HTTP_CONNECTION_LIMIT_PER_HOST = 8
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+TFIDF_CACHE_SIZE = 8
+LEMMA_CACHE_SIZE = 4096
+TIMING_CACHE_SIZE = 64
+SCENE_FPS = 30
+NVENC_RENDER_ARGS = ('-c:v', 'h264_nvenc', '-preset', 'p5', '-tune', 'hq', '-rc', 'vbr', '-cq', '23')
+VIDEOTOOLBOX_RENDER_ARGS = ('-c:v', 'h264_videotoolbox', '-b:v', '8M')
+SOFTWARE_RENDER_ARGS = ('-c:v', 'libx264', '-preset', 'veryfast', '-crf', '23')
+NVENC_INTERMEDIATE_ARGS = ('-c:v', 'h264_nvenc', '-preset', 'p1', '-tune', 'll')
+SOFTWARE_INTERMEDIATE_ARGS = ('-c:v', 'libx264', '-preset', 'ultrafast')
+RENDER_CONCURRENCY = 1
+# libx264 is already multi-threaded, so half the cores' worth of encodes keeps the machine busy without thrashing
+FFMPEG_CONCURRENCY = max(1, (os.cpu_count() or 2) // 2)
+# Consumer GPUs cap concurrent NVENC sessions at a few, and the final render may need one too
+NVENC_CONCURRENCY = 2
+SCENE_SCALE_FILTER = (f"scale={YOUTUBE_SHORT_RESOLUTION[0]}:{YOUTUBE_SHORT_RESOLUTION[1]}:force_original_aspect_ratio=increase,"
+                      f"crop={YOUTUBE_SHORT_RESOLUTION[0]}:{YOUTUBE_SHORT_RESOLUTION[1]}")
+# Every scene clip ends in the same frame rate, SAR and pixel format so the concat step never has to reconcile them
+SCENE_NORMALIZE_FILTER = f"setsar=1,fps={SCENE_FPS},format=yuv420p"
+# Each storyboard line is an optional scene header ("3."), then a "Key: value" pair or free text
+_STORYBOARD_TOKEN_RE = re.compile(
+    r'^[ \t]*(?:(?P<number>\d{1,2})\.(?=\s|$)[ \t]*)?'
+    r'(?:(?P<key>[^:\n]+?)[ \t]*:[ \t]*(?P<value>[^\n]*?)|(?P<other>[^\n]*?))[ \t\r]*$',
+    re.MULTILINE)
+# Parts of speech kept as storyboard keywords, alongside any named entity
+_KEEP_POS = frozenset({'NOUN', 'PROPN'})
 
 # Load API keys from environment variables
 groq_api_key = os.getenv("GROQ_API_KEY")
@@ -59,8 +121,37 @@ tavily_api_key = os.getenv("TAVILY_API_KEY")
 SESSION_ID = os.getenv("TIKTOK_SESSION_ID")
 
 # Helper functions
+_groq_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGroq]' = weakref.WeakKeyDictionary()
+
+def get_groq() -> AsyncGroq:
+    """Returns the AsyncGroq client for the running event loop, creating it on first use."""
+    # httpx connection pools are bound to their event loop, so cache one client per loop
+    loop = asyncio.get_running_loop()
+    client = _groq_clients.get(loop)
+    if client is None:
+        # retry_transient is the only retry policy, so turn off the SDK's own retries
+        client = AsyncGroq(api_key=groq_api_key, max_retries=0)
+        _groq_clients[loop] = client
+    return client
+
+async def close_groq():
+    """Closes the AsyncGroq client of the running event loop, if one was created."""
+    client = _groq_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+@functools.lru_cache(maxsize=1)
+def get_together() -> Together:
+    """Returns the process-wide Together client."""
+    return Together(api_key=together_api_key)
+
+async def run_in_thread(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Runs a blocking call in the default executor (asyncio.to_thread needs Python 3.9)."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
 async def get_data(query: str) -> List[Dict[str, Any]]:
-    groq = AsyncGroq(api_key=groq_api_key)
+    groq = get_groq()
     data = await groq.query(query)
     return data
 
@@ -74,110 +165,216 @@ class PixelFormat(Enum):
     YUV444P = 'yuv444p'
     YUV440P = 'yuv440p'
 
+# Deprecated full-range (JPEG) pixel formats and their standard equivalents
+_PIX_FMT_MAP = {
+    PixelFormat.YUVJ420P.value: PixelFormat.YUV420P.value,
+    PixelFormat.YUVJ422P.value: PixelFormat.YUV422P.value,
+    PixelFormat.YUVJ444P.value: PixelFormat.YUV444P.value,
+    PixelFormat.YUVJ440P.value: PixelFormat.YUV440P.value,
+}
+
 def get_compatible_pixel_format(pix_fmt: str) -> str:
     """Convert deprecated pixel formats to their compatible alternatives."""
-    if pix_fmt == PixelFormat.YUVJ420P.value:
-        return PixelFormat.YUV420P.value
-    elif pix_fmt == PixelFormat.YUVJ422P.value:
-        return PixelFormat.YUV422P.value
-    elif pix_fmt == PixelFormat.YUVJ444P.value:
-        return PixelFormat.YUV444P.value
-    elif pix_fmt == PixelFormat.YUVJ440P.value:
-        return PixelFormat.YUV440P.value
-    else:
-        return pix_fmt
+    return _PIX_FMT_MAP.get(pix_fmt, pix_fmt)
 
 
 def check_api_keys():
     for key in REQUIRED_API_KEYS:
         if not os.getenv(key):
             raise ValueError(f"Missing required API key: {key}")
-        
 
-def align_with_gentle(audio_file: str, transcript_file: str) -> dict:
+
+class AppContext:
+    """Owns the network clients shared by every step of a workflow run."""
+
+    def __init__(self):
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.render_semaphore: Optional[asyncio.Semaphore] = None
+        self.image_semaphore: Optional[asyncio.Semaphore] = None
+        self.tts_semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> 'AppContext':
+        connector = aiohttp.TCPConnector(limit=HTTP_CONNECTION_LIMIT, limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST)
+        self.session = aiohttp.ClientSession(connector=connector)
+        # Concurrent workflows overlap their network stages but take turns at the CPU-heavy final render
+        self.render_semaphore = asyncio.Semaphore(RENDER_CONCURRENCY)
+        # The image and TTS rate limits apply to all workflows together, not to each one
+        self.image_semaphore = asyncio.Semaphore(IMAGE_GENERATION_CONCURRENCY)
+        self.tts_semaphore = asyncio.Semaphore(TTS_CONCURRENCY)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+        await close_groq()
+
+
+@asynccontextmanager
+async def use_session(session: Optional[aiohttp.ClientSession] = None) -> AsyncIterator[aiohttp.ClientSession]:
+    """Yields the given session, or a temporary one when none is shared."""
+    if session is not None:
+        yield session
+    else:
+        async with aiohttp.ClientSession() as temporary_session:
+            yield temporary_session
+
+
+async def download_with_retry(url: str, directory: str, filename: str, headers: Dict[str, str] = None,
+                              max_retries: int = 3, session: Optional[aiohttp.ClientSession] = None) -> str:
+    """Downloads a file with retries."""
+    async with use_session(session) as session:
+        for attempt in range(max_retries):
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 200:
+                        file_path = os.path.join(directory, filename)
+                        async with aiofiles.open(file_path, 'wb') as f:
+                            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                                await f.write(chunk)
+                        return file_path
+                    else:
+                        logger.warning(f"Download attempt {attempt + 1} failed: HTTP {response.status}")
+            except Exception as e:
+                logger.warning(f"Download attempt {attempt + 1} failed: {str(e)}")
+    return None
+
+
+async def align_with_gentle(audio_file: str, transcript_file: str,
+                            session: Optional[aiohttp.ClientSession] = None) -> dict:
     """Aligns audio and text using Gentle and returns the alignment result."""
     url = 'http://localhost:8765/transcriptions?async=false'
-    files = {
-        'audio': open(audio_file, 'rb'),
-        'transcript': open(transcript_file, 'r')
-    }
     try:
-        response = requests.post(url, files=files)
-        response.raise_for_status()
-        result = response.json()
-        return result
-    except requests.exceptions.RequestException as e:
+        with open(audio_file, 'rb') as audio, open(transcript_file, 'rb') as transcript:
+            data = aiohttp.FormData()
+            data.add_field('audio', audio, filename=os.path.basename(audio_file))
+            data.add_field('transcript', transcript, filename=os.path.basename(transcript_file))
+            async with use_session(session) as session:
+                # Alignment of a long voiceover can take minutes, so don't time out
+                async with session.post(url, data=data, timeout=aiohttp.ClientTimeout(total=None)) as response:
+                    response.raise_for_status()
+                    return await response.json()
+    except aiohttp.ClientError as e:
         logger.error(f"Error communicating with Gentle: {e}")
         return None
 
 def gentle_alignment_to_srt(gentle_alignment: dict, srt_file: str):
     """Converts Gentle alignment JSON to SRT subtitle format."""
-    from datetime import timedelta
+    cues = []
+    index = 1
+    for word_info in gentle_alignment.get('words', []):
+        start = word_info.get('start')
+        end = word_info.get('end')
+        if start is not None and end is not None:
+            text = word_info.get('word', '')
+            cues.append(f"{index}\n{format_time(start)} --> {format_time(end)}\n{text}\n\n")
+            index += 1
 
     with open(srt_file, 'w', encoding='utf-8') as f:
-        index = 1
-        for word_info in gentle_alignment.get('words', []):
-            start = word_info.get('start')
-            end = word_info.get('end')
-            if start is not None and end is not None:
-                start_time = str(timedelta(seconds=start))
-                end_time = str(timedelta(seconds=end))
-                text = word_info.get('word', '')
-
-                f.write(f"{index}\n")
-                f.write(f"{format_time(start)} --> {format_time(end)}\n")
-                f.write(f"{text}\n\n")
-                index += 1
+        f.write("".join(cues))
 
 
 def wrap_text(text, max_width):
     """Wraps text to multiple lines with a maximum width."""
     words = text.split()
-    lines = []
-    current_line = []
-    current_length = 0
+    if not words:
+        return ''
 
-    for word in words:
-        if current_length + len(word) + 1 <= max_width:
-            current_line.append(word)
-            current_length += len(word) + 1
+    lines = []
+    line_start = 0
+    line_length = 0
+    for i, word in enumerate(words):
+        word_length = len(word)
+        if line_length and line_length + 1 + word_length > max_width:
+            lines.append(' '.join(words[line_start:i]))
+            line_start = i
+            line_length = word_length
         else:
-            lines.append(' '.join(current_line))
-            current_line = [word]
-            current_length = len(word)
-
-    if current_line:
-        lines.append(' '.join(current_line))
+            line_length += word_length + 1 if line_length else word_length
+    lines.append(' '.join(words[line_start:]))
 
     return '\\N'.join(lines)  # Include all lines
 
 
 def format_time(seconds: float) -> str:
     """Formats time in seconds to HH:MM:SS,mmm format for subtitles."""
-    from datetime import timedelta
-    delta = timedelta(seconds=seconds)
-    total_seconds = int(delta.total_seconds())
-    millis = int((delta.total_seconds() - total_seconds) * 1000)
-    time_str = str(delta)
-    if '.' in time_str:
-        time_str, _ = time_str.split('.')
-    else:
-        time_str = time_str
-    time_str = time_str.zfill(8)  # Ensure at least HH:MM:SS
-    return f"{time_str},{millis:03d}"
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
 
 # Abstract classes for Agents and Tools
 class Agent(ABC):
-    def __init__(self, name: str, model: str):
+    def __init__(self, name: str, model: str, stream: bool = True):
         self.name = name
         self.model = model
+        self.stream = stream
 
     @abstractmethod
     async def execute(self, input_data: Any) -> Any:
         pass
 
+    async def _complete(self, **kwargs) -> str:
+        """Runs a Groq chat completion, streaming the response only if the agent streams."""
+        if self.stream:
+            return "".join([delta async for delta in self._stream(**kwargs)])
+        client = get_groq()
+        # A plain response skips per-chunk SSE parsing for small outputs
+        response = await client.chat.completions.create(**kwargs)
+        return response.choices[0].message.content
+
+    async def _stream(self, **kwargs) -> AsyncIterator[str]:
+        """Yields the content deltas of a streamed Groq chat completion as they arrive."""
+        stream = await get_groq().chat.completions.create(stream=True, **kwargs)
+        async for chunk in stream:
+            content = chunk.choices[0].delta.content
+            if content:
+                yield content
+
+    async def _complete_cached(self, **kwargs) -> str:
+        """Like _complete, but reuses a stored response for an identical request."""
+        return await get_or_call(completion_cache_key(kwargs), lambda: self._complete(**kwargs))
+
+def completion_cache_key(request: Dict[str, Any]) -> str:
+    """Hashes a chat completion request into a response cache key."""
+    return hashlib.sha256(json.dumps(request, sort_keys=True).encode('utf-8')).hexdigest()
+
+def read_cache_entry(cache_dir: str, key: str, ttl: float) -> Optional[Any]:
+    """Returns the cached value for key, or None if it is missing or older than ttl seconds."""
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)['value']
+    except (OSError, ValueError, KeyError):
+        return None
+
+def write_cache_entry(cache_dir: str, key: str, value: Any) -> None:
+    """Stores value under key, replacing the entry atomically."""
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, f"{key}.json")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'value': value}, f)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        logger.warning(f"Could not write cache entry {key}: {str(e)}")
+
+async def get_or_call(key: str, coro_factory: Callable[[], Any],
+                      cache_dir: str = LLM_CACHE_DIR, ttl: float = LLM_CACHE_TTL) -> Any:
+    """Returns the cached value for key, awaiting coro_factory() and caching its result on a miss."""
+    cached = read_cache_entry(cache_dir, key, ttl)
+    if cached is not None:
+        logger.info(f"Cache hit for {key[:12]}")
+        return cached
+    value = await coro_factory()
+    if value:
+        write_cache_entry(cache_dir, key, value)
+    return value
+
 class Tool(ABC):
     def __init__(self, name: str):
         self.name = name
@@ -218,6 +415,34 @@ class Node:
             raise ValueError("Node has neither agent nor tool")
 
 
+# Rate limits, 5xx responses and dropped connections usually succeed on a later attempt
+TRANSIENT_ERRORS = (APIConnectionError, RateLimitError, InternalServerError, aiohttp.ClientError, asyncio.TimeoutError)
+
+async def retry_transient(coro_factory: Callable[[], Any], attempts: int = RETRY_ATTEMPTS) -> Any:
+    """Awaits coro_factory(), retrying transient API and network failures with exponential backoff."""
+    for attempt in range(1, attempts + 1):
+        try:
+            return await coro_factory()
+        except TRANSIENT_ERRORS as e:
+            if attempt == attempts:
+                raise
+            delay = min(2 ** (attempt - 1), RETRY_MAX_DELAY)
+            logger.warning(f"Transient error ({type(e).__name__}: {str(e)}), retrying in {delay}s "
+                           f"(attempt {attempt}/{attempts})")
+            await asyncio.sleep(delay)
+
+async def cached_process(node: Node, input_data: Any) -> Any:
+    """Runs node.process, reusing the stored output when the same agent has already seen identical input."""
+    payload = json.dumps(input_data, sort_keys=True, default=str)
+    key = hashlib.sha256(f"{node.agent.name}:{payload}".encode('utf-8')).hexdigest()
+    return await get_or_call(key, lambda: retry_transient(lambda: node.process(input_data)),
+                             AGENT_CACHE_DIR, AGENT_CACHE_TTL)
+
+
+class WorkflowStepError(Exception):
+    """Raised when a workflow agent step fails after its retries."""
+
+
 class Edge:
     def __init__(self, source: Node, target: Node, condition: Callable[[Any], bool] = None):
         self.source = source
@@ -236,46 +461,126 @@ class Graph:
         self.edges.append(edge)
         edge.source.edges.append(edge)
 
+@functools.lru_cache(maxsize=TFIDF_CACHE_SIZE)
+def fit_tfidf(corpus: Tuple[str, ...]) -> Tuple[TfidfVectorizer, Any]:
+    """Fits a TF-IDF vectorizer on a candidate corpus and returns it with the corpus matrix."""
+    vectorizer = TfidfVectorizer(stop_words='english', lowercase=True, ngram_range=(1, 1))
+    matrix = vectorizer.fit_transform(corpus)
+    return vectorizer, matrix
+
 class VideoProcessor:
     def __init__(self):
-        self.nlp = nlp
+        self.nlp = get_nlp()
+        self._lemma_cache: Dict[str, frozenset] = {}
+        self._timing_cache: Dict[int, Tuple[List[Dict[str, Any]], Tuple[np.ndarray, np.ndarray, List[str]]]] = {}
 
     def calculate_relevance(self, video: Dict[str, Any], description: str, timestamp: float) -> float:
-        relevance = 0
-        video_keywords = set(video.get("tags", []))
-        description_doc = self.nlp(description.lower())
+        return self.score_videos([video], description, timestamp)[0]
 
-        # Extract lemmatized words from the description
-        description_words = set(token.lemma_ for token in description_doc if not token.is_stop and token.is_alpha)
+    def score_videos(self, videos: List[Dict[str, Any]], description: str, timestamp: float) -> List[float]:
+        """Scores candidate videos against a description using a single batched spaCy pass."""
+        if not videos:
+            return []
 
-        # Calculate relevance based on matching words
-        relevance += len(video_keywords.intersection(description_words))
+        # Process subtitles and audio for the 5-second window
+        windows = [self.get_synced_content(video, timestamp) for video in videos]
+
+        texts = [description]
+        texts += [video.get("title") or "" for video in videos]
+        texts += [subtitle_text for subtitle_text, _ in windows]
+        texts += [audio_text for _, audio_text in windows]
+        lemma_sets = self.lemma_sets(texts)
+
+        count = len(videos)
+        description_words = lemma_sets.pop(0)
+        title_sets = lemma_sets[:count]
+        subtitle_sets = lemma_sets[count:2 * count]
+        audio_sets = lemma_sets[2 * count:]
+
+        return [
+            self._relevance(video, description_words, title_words, subtitle_words, audio_words)
+            for video, title_words, subtitle_words, audio_words in zip(videos, title_sets, subtitle_sets, audio_sets)
+        ]
 
-        # Add relevance for matching title words
-        title = video.get("title", "")
-        if title is not None:
-            title_doc = self.nlp(title.lower())
-            title_words = set(token.lemma_ for token in title_doc if not token.is_stop and token.is_alpha)
-            relevance += len(title_words.intersection(description_words)) * 2  # Title matches are weighted more
+    def rank(self, videos: List[Dict[str, Any]], description: str, timestamp: float) -> List[float]:
+        """Scores candidate videos against a description with TF-IDF vectors and cosine similarity."""
+        if not videos:
+            return []
 
-        # Process subtitles and audio for the 5-second window
-        subtitle_text, audio_text = self.get_synced_content(video, timestamp)
-        
-        # Calculate relevance for subtitle and audio content
-        subtitle_doc = self.nlp(subtitle_text.lower())
-        audio_doc = self.nlp(audio_text.lower())
-        
-        subtitle_words = set(token.lemma_ for token in subtitle_doc if not token.is_stop and token.is_alpha)
-        audio_words = set(token.lemma_ for token in audio_doc if not token.is_stop and token.is_alpha)
-        
+        tags = [" ".join(video.get("tags", [])) for video in videos]
+        titles = [video.get("title") or "" for video in videos]
+        transcripts = [
+            " ".join(item.get("text", "") for item in video.get("subtitles", []) + video.get("audio_transcript", []))
+            for video in videos
+        ]
+        count = len(videos)
+
+        # The vocabulary depends only on the candidate pool, so it is fitted once and
+        # reused for every scene timestamp scored against the same videos
+        try:
+            vectorizer, corpus_matrix = fit_tfidf(tuple(tags + titles + transcripts))
+        except ValueError:
+            # Every text was empty or made only of stop words
+            return [0.0] * count
+
+        windows = [self.get_synced_content(video, timestamp) for video in videos]
+        subtitles = [subtitle_text for subtitle_text, _ in windows]
+        audios = [audio_text for _, audio_text in windows]
+        window_matrix = vectorizer.transform([description] + subtitles + audios)
+
+        description_vector = window_matrix[0]
+        blocks = [
+            corpus_matrix[:count],
+            corpus_matrix[count:2 * count],
+            window_matrix[1:count + 1],
+            window_matrix[count + 1:],
+        ]
+        weights = (1, 2, 1.5, 1.5)  # Tags, titles, subtitles, audio
+        scores = sum(weight * cosine_similarity(description_vector, block) for weight, block in zip(weights, blocks))
+        return scores.ravel().tolist()
+
+    def lemma_sets(self, texts: List[str]) -> List[frozenset]:
+        """Returns the lemma set of each text, running only uncached texts through one batched spaCy pass."""
+        keys = [text.lower() for text in texts]
+        found = {key: self._lemma_cache[key] for key in keys if key in self._lemma_cache}
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing:
+            docs = self.nlp.pipe(missing, batch_size=64, n_process=1, disable=LEMMA_DISABLED_PIPES)
+            for key, doc in zip(missing, docs):
+                found[key] = frozenset(self.lemma_set(doc))
+                if len(self._lemma_cache) >= LEMMA_CACHE_SIZE:
+                    # Evict the oldest entry
+                    del self._lemma_cache[next(iter(self._lemma_cache))]
+                self._lemma_cache[key] = found[key]
+        return [found[key] for key in keys]
+
+    @staticmethod
+    def lemma_set(doc) -> set:
+        """Returns the lemmas of the non-stopword alphabetic tokens in a spaCy doc."""
+        from spacy.attrs import LEMMA, IS_STOP, IS_ALPHA
+
+        if not len(doc):
+            return set()
+        # Filter on the attribute array instead of reading each token's properties
+        attrs = doc.to_array([LEMMA, IS_STOP, IS_ALPHA])
+        keep = (attrs[:, 1] == 0) & (attrs[:, 2] == 1)
+        strings = doc.vocab.strings
+        return {strings[lemma] for lemma in attrs[keep, 0].tolist()}
+
+    @staticmethod
+    def _relevance(video: Dict[str, Any], description_words: set, title_words: set,
+                   subtitle_words: set, audio_words: set) -> float:
+        video_keywords = set(video.get("tags", []))
+
+        # Calculate relevance based on matching words
+        relevance = len(video_keywords.intersection(description_words))
+        relevance += len(title_words.intersection(description_words)) * 2  # Title matches are weighted more
         relevance += len(subtitle_words.intersection(description_words)) * 1.5  # Subtitle matches are weighted
         relevance += len(audio_words.intersection(description_words)) * 1.5  # Audio matches are weighted
 
         # Normalize relevance score
         max_possible_relevance = len(video_keywords) + len(title_words) * 2 + len(subtitle_words) * 1.5 + len(audio_words) * 1.5
-        normalized_relevance = relevance / max_possible_relevance if max_possible_relevance > 0 else 0
-
-        return normalized_relevance
+        return relevance / max_possible_relevance if max_possible_relevance > 0 else 0
 
     def get_synced_content(self, video: Dict[str, Any], timestamp: float) -> Tuple[str, str]:
         subtitles = video.get("subtitles", [])
@@ -290,28 +595,41 @@ class VideoProcessor:
         return subtitle_text, audio_text
 
     def extract_timed_content(self, content: List[Dict[str, Any]], start_time: float, end_time: float) -> str:
-        extracted_text = []
-        for item in content:
-            item_start = self.time_to_seconds(item.get("start", "00:00:00"))
-            item_end = self.time_to_seconds(item.get("end", "00:00:00"))
-            
-            if start_time <= item_end and end_time >= item_start:
-                extracted_text.append(item.get("text", ""))
-
-        return " ".join(extracted_text)
+        if not content:
+            return ""
+        starts, ends, texts = self._prepare(content)
+        mask = (starts <= end_time) & (ends >= start_time)
+        return " ".join(texts[i] for i in np.flatnonzero(mask))
+
+    def _prepare(self, content: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """Parses the timestamps of a timed content list once and caches them as arrays."""
+        cached = self._timing_cache.get(id(content))
+        # Keep a reference to the list so its id cannot be reused while cached
+        if cached is not None and cached[0] is content:
+            return cached[1]
+
+        starts = np.fromiter((self.time_to_seconds(item.get("start", "00:00:00")) for item in content),
+                             dtype=np.float64, count=len(content))
+        ends = np.fromiter((self.time_to_seconds(item.get("end", "00:00:00")) for item in content),
+                           dtype=np.float64, count=len(content))
+        texts = [item.get("text", "") for item in content]
+        prepared = (starts, ends, texts)
+        if len(self._timing_cache) >= TIMING_CACHE_SIZE:
+            # Evict the oldest entry so the cache does not pin every content list it has seen
+            del self._timing_cache[next(iter(self._timing_cache))]
+        self._timing_cache[id(content)] = (content, prepared)
+        return prepared
 
     def time_to_seconds(self, time_str: str) -> float:
-        time_parts = time_str.split(":")
-        if len(time_parts) == 3:
-            return datetime.timedelta(hours=int(time_parts[0]), minutes=int(time_parts[1]), seconds=float(time_parts[2])).total_seconds()
-        elif len(time_parts) == 2:
-            return datetime.timedelta(minutes=int(time_parts[0]), seconds=float(time_parts[1])).total_seconds()
-        else:
-            return float(time_str)
+        seconds = 0.0
+        for part in str(time_str).split(":"):
+            seconds = seconds * 60 + float(part)
+        return seconds
 
 class WebSearchTool(Tool):
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         super().__init__("Web Search Tool")
+        self.session = session
 
     async def use(self, input_data: str, time_period: str = 'all') -> Dict[str, Any]:
         try:
@@ -334,77 +652,113 @@ class WebSearchTool(Tool):
                 if start_date:
                     data["from_date"] = start_date.strftime("%Y-%m-%d")
 
-            async with aiohttp.ClientSession() as session:
+            async with use_session(self.session) as session:
                 async with session.post("https://api.tavily.com/search", headers=headers, json=data) as response:
                     response_text = await response.text()
                     if response.status == 200:
                         return await response.json()
                     else:
                         logger.error(f"WebSearchTool Error: HTTP {response.status} - {response_text}")
+                        if response.status == 429 or response.status >= 500:
+                            # Raised as aiohttp.ClientResponseError so retry_transient backs off and tries again
+                            response.raise_for_status()
                         raise Exception(f"HTTP {response.status}: {response_text}")
         except Exception as e:
             logger.error(f"Error in WebSearchTool: {str(e)}")
             raise
 
 class ImageGenerationAgent(Agent):
-    def __init__(self):
+    def __init__(self, semaphore: Optional[asyncio.Semaphore] = None):
         super().__init__("Image Generation Agent", "black-forest-labs/FLUX.1-schnell-Free")
-        self.client = Together(api_key=together_api_key)
+        self.client = get_together()
+        # Shared by every caller so all in-flight API requests stay within the rate limit together
+        self.semaphore = semaphore or asyncio.Semaphore(IMAGE_GENERATION_CONCURRENCY)
 
     async def execute(self, input_data: Dict[str, Any]) -> Any:
         scenes = input_data.get('scenes', [])
-        results = []
+        # Submit every scene at once; generate_image bounds the actual API requests
+        results = await asyncio.gather(*[self.generate_image(i, scene, len(scenes)) for i, scene in enumerate(scenes)],
+                                       return_exceptions=True)
+        results = [None if isinstance(result, BaseException) else result for result in results]
 
-        for i, scene in enumerate(scenes):
-            visual_description = scene.get('visual', '')
-            image_keyword = scene.get('image_keyword', '')
+        logger.info(f"Image generation completed. Generated {len([r for r in results if r is not None])}/{len(scenes)} images.")
+        return results
 
-            # Combine the visual description and image keyword for a more detailed prompt
-            prompt = prompt = f"""
+    async def generate_image(self, i: int, scene: Dict[str, Any],
+                             scene_count: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        visual_description = scene.get('visual', '')
+        image_keyword = scene.get('image_keyword', '')
+
+        # Combine the visual description and image keyword for a more detailed prompt
+        prompt = f"""
 Create a image that will go viral on youtube based on the following scene description:
 {visual_description},{image_keyword}
 """
-            try:
-                logger.info(f"Generating image for scene {i+1}/{len(scenes)}")
-                response = self.client.images.generate(
-                    prompt=prompt,
-                    model=self.model,
-                    width=768,
-                    height=1024,
-                    steps=4,
-                    n=1,
-                    response_format="b64_json"
-                )
+        # A fixed per-scene seed makes the output reproducible, so it can be cached by its request
+        seed = scene.get('number') or i + 1
+        width, height, steps = 768, 1024, 4
+        key = hashlib.sha256(f"{prompt}|{self.model}|{width}x{height}|{steps}|{seed}".encode('utf-8')).hexdigest()
+        cached_image = os.path.join(IMAGE_CACHE_DIR, f"{key}.png")
+        # The total is unknown while the storyboard is still streaming
+        progress = f"/{scene_count}" if scene_count else ""
+
+        try:
+            if os.path.exists(cached_image):
+                logger.info(f"Using cached image for scene {i+1}{progress}")
+                with open(cached_image, 'rb') as f:
+                    image_data = f.read()
+            else:
+                async with self.semaphore:
+                    logger.info(f"Generating image for scene {i+1}{progress}")
+                    # The Together client is synchronous, so run it off the event loop
+                    response = await run_in_thread(
+                        self.client.images.generate,
+                        prompt=prompt,
+                        model=self.model,
+                        width=width,
+                        height=height,
+                        steps=steps,
+                        seed=seed,
+                        n=1,
+                        response_format="b64_json"
+                    )
 
                 # Decode the base64 image
                 image_data = base64.b64decode(response.data[0].b64_json)
+                self.store_cached_image(cached_image, image_data)
 
-                # Save the image to a temporary file
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp_file:
-                    temp_file.write(image_data)
-                    temp_file_path = temp_file.name
+            # Save the image to a temporary file
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp_file:
+                temp_file.write(image_data)
+                temp_file_path = temp_file.name
 
-                logger.info(f"Image for scene {i+1} saved as {temp_file_path}")
+            logger.info(f"Image for scene {i+1} saved as {temp_file_path}")
 
-                results.append({
-                    'image_path': temp_file_path,
-                    'prompts': prompt
-                })
+            return {
+                'image_path': temp_file_path,
+                'prompts': prompt
+            }
 
-            except Exception as e:
-                logger.error(f"Error in image generation for scene {i+1}: {str(e)}")
-                results.append(None)
+        except Exception as e:
+            logger.error(f"Error in image generation for scene {i+1}: {str(e)}")
+            return None
 
-            # Add a delay between requests to avoid rate limiting
-            await asyncio.sleep(2)
+    @staticmethod
+    def store_cached_image(cached_image: str, image_data: bytes) -> None:
+        """Writes a generated image into the image cache, replacing any partial entry atomically."""
+        try:
+            os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cached_image}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(image_data)
+            os.replace(tmp_path, cached_image)
+        except OSError as e:
+            logger.warning(f"Could not cache image {cached_image}: {str(e)}")
 
-        logger.info(f"Image generation completed. Generated {len([r for r in results if r is not None])}/{len(scenes)} images.")
-        return results
-        
 class RecentEventsResearchAgent(Agent):
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         super().__init__("Recent Events Research Agent", "llama-3.1-70b-versatile")
-        self.web_search_tool = WebSearchTool()
+        self.web_search_tool = WebSearchTool(session)
 
     async def execute(self, input_data: Dict[str, Any]) -> Any:
         topic = input_data['topic']
@@ -419,7 +773,6 @@ class RecentEventsResearchAgent(Agent):
 
         organic_results = search_results.get("organic_results", [])
 
-        client = AsyncGroq(api_key=groq_api_key)
         prompt = f"""As a seasoned investigative journalist and expert in crafting viral scripts,
 your task is to analyze and summarize the most enagaging and relevant {topic} events
 that occurred in the {time_frame}. Using the following search results, select the {max_events} most
@@ -439,7 +792,7 @@ Format your response as a list of events, each separated by two newline characte
 Ensure your summaries are both informative and captivating, suitable for a
 documentary-style presentation."""
 
-        stream = await client.chat.completions.create(
+        return await self._complete(
             messages=[
                 {"role": "system",
                  "content": "You are an AI assistant embodying the expertise of a world-renowned "
@@ -456,12 +809,7 @@ documentary-style presentation."""
             model=self.model,
             temperature=0.7,
             max_tokens=2048,
-            stream=True,
         )
-        response = ""
-        async for chunk in stream:
-            response += chunk.choices[0].delta.content or ""
-        return response
 
 
 # Updated AI Agents for YouTube content optimization
@@ -471,7 +819,6 @@ class TitleGenerationAgent(Agent):
 
     async def execute(self, input_data: Any) -> Any:
         research_result = input_data  # Accept research output
-        client = AsyncGroq(api_key=groq_api_key)
         prompt = f"""Using the following research, generate 15 enticing keyword YouTube titles:
 
 Research:
@@ -481,7 +828,7 @@ Categorize them under appropriate headings: beginning, middle, and end. This mea
 produce 5 titles with the keyword at the beginning, another 5 titles with the keyword in the
 middle, and a final 5 titles with the keyword at the end."""
 
-        stream = await client.chat.completions.create(
+        return await self._complete(
             messages=[
                 {"role": "system", "content": "You are an expert in keyword strategy, copywriting, and a renowned YouTuber "
                                               "with a decade of experience in crafting attention-grabbing keyword titles"},
@@ -490,21 +837,15 @@ middle, and a final 5 titles with the keyword at the end."""
             model=self.model,
             temperature=0.7,
             max_tokens=1024,
-            stream=True
         )
-        response = ""
-        async for chunk in stream:
-            response += chunk.choices[0].delta.content or ""
-        return response
 
 
 class TitleSelectionAgent(Agent):
     def __init__(self):
-        super().__init__("Title Selection Agent", "llama-3.1-8b-instant")
+        super().__init__("Title Selection Agent", "llama-3.1-8b-instant", stream=False)
 
     async def execute(self, input_data: Any) -> Any:
         generated_titles = input_data  # Accept generated titles
-        client = AsyncGroq(api_key=groq_api_key)
         prompt = f"""You are an expert YouTube content strategist with over a decade of experience
 in video optimization and audience engagement. Your task is to analyze the following list of
 titles for a YouTube video and select the most effective one:
@@ -524,7 +865,7 @@ considering factors such as:
 Present your selection and offer a comprehensive rationale for why this title stands out among
 the others."""
 
-        stream = await client.chat.completions.create(
+        return await self._complete(
             messages=[
                 {"role": "system",
                  "content": "You are an AI assistant embodying the expertise of a top-tier YouTube "
@@ -540,12 +881,7 @@ the others."""
             model=self.model,
             temperature=0.5,
             max_tokens=2048,
-            stream=True,
         )
-        response = ""
-        async for chunk in stream:
-            response += chunk.choices[0].delta.content or ""
-        return response
 
 class DescriptionGenerationAgent(Agent):
     def __init__(self):
@@ -553,7 +889,6 @@ class DescriptionGenerationAgent(Agent):
 
     async def execute(self, input_data: Any) -> Any:
         selected_title = input_data  # Accept selected title
-        client = AsyncGroq(api_key=groq_api_key)
         prompt = f"""As a seasoned SEO copywriter and YouTube content creator with extensive 
 experience in crafting engaging, algorithm-friendly video descriptions, your task is to compose 
 a masterful 1000-character YouTube video description. This description should:
@@ -568,7 +903,7 @@ Format the description with the title "YOUTUBE DESCRIPTION" in bold at the top.
 Ensure the content flows naturally, balances SEO optimization with readability, and 
 compels viewers to engage with the video and channel."""
 
-        stream = await client.chat.completions.create(
+        return await self._complete(
             messages=[
                 {"role": "system",
                  "content": "You are an AI assistant taking on the role of an elite SEO copywriter "
@@ -584,20 +919,14 @@ compels viewers to engage with the video and channel."""
             model=self.model,
             temperature=0.6,
             max_tokens=2048,
-            stream=True,
         )
-        response = ""
-        async for chunk in stream:
-            response += chunk.choices[0].delta.content or ""
-        return response
 
 class HashtagAndTagGenerationAgent(Agent):
     def __init__(self):
-        super().__init__("Hashtag and Tag Generation Agent", "llama-3.1-8b-instant")
+        super().__init__("Hashtag and Tag Generation Agent", "llama-3.1-8b-instant", stream=False)
 
     async def execute(self, input_data: str) -> Any:
         selected_title = input_data  # Accept selected title
-        client = AsyncGroq(api_key=groq_api_key)
         prompt = f"""As a leading YouTube SEO specialist and social media strategist with a 
 proven track record in optimizing video discoverability and virality, your task is to create an 
 engaging and relevant set of hashtags and tags for the YouTube video titled "{selected_title}". 
@@ -622,7 +951,7 @@ Present your hashtags with the '#' symbol and ensure all tags are separated by c
 brief explanation of your strategy for selecting these hashtags and tags, highlighting how they 
 will contribute to the video's overall performance on YouTube."""
 
-        response = await client.chat.completions.create(
+        return await self._complete(
             messages=[
                 {"role": "system",
                  "content": "You are an AI assistant taking on the role of a leading YouTube SEO "
@@ -639,7 +968,6 @@ will contribute to the video's overall performance on YouTube."""
             temperature=0.6,
             max_tokens=1024,
         )
-        return response.choices[0].message.content
 
 class VideoScriptGenerationAgent(Agent):
     def __init__(self):
@@ -648,7 +976,6 @@ class VideoScriptGenerationAgent(Agent):
     async def execute(self, input_data: Dict[str, Any]) -> Any:
         research_result = input_data.get('research', '')
         video_length = input_data.get('video_length', 60)  # Default to 60 seconds if not specified
-        client = AsyncGroq(api_key=groq_api_key)
         prompt = f"""As a YouTube content creator, craft a detailed, engaging and entralling script for a 
 {video_length}-second vertical video based on the following information:
 
@@ -662,7 +989,7 @@ Your script should include:
 Format the script with clear timestamps to fit within {video_length} seconds. 
 Optimize for viewer retention and engagement."""
 
-        stream = await client.chat.completions.create(
+        return await self._complete(
             messages=[
                 {"role": "system", "content": "You are an AI assistant taking on the role of a leading YouTube SEO "
                                               "specialist and content creator with a deep understanding of audience engagement."},
@@ -671,46 +998,89 @@ Optimize for viewer retention and engagement."""
             model=self.model,
             temperature=0.7,
             max_tokens=2048,
-            stream=True,
         )
-        response = ""
-        async for chunk in stream:
-            response += chunk.choices[0].delta.content or ""
-        return response
 
 
-    async def download_with_retry(url: str, directory: str, filename: str, headers: Dict[str, str] = None,
-                                max_retries: int = 3) -> str:
-        """Downloads a file with retries."""
-        for attempt in range(max_retries):
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, headers=headers) as response:
-                        if response.status == 200:
-                            file_path = os.path.join(directory, filename)
-                            async with aiofiles.open(file_path, 'wb') as f:
-                                await f.write(await response.read())
-                            return file_path
-                        else:
-                            logger.warning(f"Download attempt {attempt + 1} failed: HTTP {response.status}")
-            except Exception as e:
-                logger.warning(f"Download attempt {attempt + 1} failed: {str(e)}")
-        return None
+class StoryboardParser:
+    """Incrementally parses a storyboard response into scenes as its text arrives."""
+
+    def __init__(self, finalize_scene: Callable[[Dict[str, Any], int], Dict[str, Any]]):
+        self.finalize_scene = finalize_scene
+        self.scenes = []
+        self.current_scene = {}
+        self.current_scene_number = None
+        self.buffer = ""
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """Parses every complete line in text and returns the scenes it completed."""
+        self.buffer += text
+        end = self.buffer.rfind('\n')
+        if end < 0:
+            return []
+        complete, self.buffer = self.buffer[:end], self.buffer[end + 1:]
+        completed = []
+        # One scan tokenizes every complete line into a scene header and/or a key:value pair
+        for token in _STORYBOARD_TOKEN_RE.finditer(complete):
+            scene = self.parse_token(token)
+            if scene:
+                completed.append(scene)
+        return completed
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Parses any trailing partial line and returns the scenes completed by the end of the response."""
+        completed = self.feed('\n')
+        scene = self.finish_scene()
+        if scene:
+            logger.debug(f"Final scene {scene['number']} appended to scenes list")
+            completed.append(scene)
+        return completed
+
+    def parse_token(self, token: re.Match) -> Optional[Dict[str, Any]]:
+        scene = None
+        if token['number']:
+            scene = self.finish_scene()
+            # Start a new scene
+            self.current_scene_number = int(token['number'])
+            logger.debug(f"New scene number detected: {self.current_scene_number}")
+        if token['key']:
+            # A header such as "1. Visual: ..." carries the scene's first field on the same line
+            key = token['key'].lower()
+            value = token['value']
+            self.current_scene[key] = value
+            logger.debug(f"Key-value pair added to current scene: {key}:{value}")
+        elif token['other'] and not token['number']:
+            logger.warning(f"Line format not recognized: {token['other']}")
+        return scene
 
+    def finish_scene(self) -> Optional[Dict[str, Any]]:
+        if not self.current_scene:
+            return None
+        # Append the completed current_scene, validated by the agent
+        scene = self.current_scene
+        scene['number'] = self.current_scene_number
+        scene = self.finalize_scene(scene, self.current_scene_number)
+        self.scenes.append(scene)
+        logger.debug(f"Scene {self.current_scene_number} appended to scenes list")
+        self.current_scene = {}
+        return scene
 
 class StoryboardGenerationAgent(Agent):
     def __init__(self):
         super().__init__("Storyboard Generation Agent", "llama-3.1-70b-versatile")
-        self.nlp = nlp
+        self.nlp = get_nlp()
+        self.image_generation_agent = ImageGenerationAgent()
 
     async def execute(self, input_data: Dict[str, Any]) -> Any:
         script = input_data.get('script', '')
+        scene_queue = input_data.get('scene_queue')
         
         if not script:
             logger.error("No script provided for storyboard generation")
+            if scene_queue is not None:
+                # Tell the consumer no scenes are coming
+                scene_queue.put_nowait(None)
             return []
 
-        client = AsyncGroq(api_key=groq_api_key)
         prompt = f"""Create a storyboard for a YouTube Short based on the following script:
 
 {script}
@@ -740,7 +1110,7 @@ Example:
 
 Please ensure each scene has all four elements (Visual, Text, Video Keyword, and Image Keyword)."""
 
-        stream = await client.chat.completions.create(
+        request = dict(
             messages=[
                 {"role": "system",
                  "content": "You are an AI assistant specializing in creating detailed storyboards "
@@ -750,11 +1120,13 @@ Please ensure each scene has all four elements (Visual, Text, Video Keyword, and
             model=self.model,
             temperature=0.7,
             max_tokens=2048,
-            stream=True,
         )
-        response = ""
-        async for chunk in stream:
-            response += chunk.choices[0].delta.content or ""
+
+        if scene_queue is not None:
+            # Hand each scene to the consumer as soon as it has been streamed
+            return await self.stream_scenes(scene_queue, **request)
+
+        response = await self._complete_cached(**request)
 
         logger.info(f"Raw storyboard response: {response}")
         scenes = self.parse_scenes(response)
@@ -763,104 +1135,125 @@ Please ensure each scene has all four elements (Visual, Text, Video Keyword, and
             return []
         
         return scenes
+
+    async def stream_scenes(self, scene_queue: asyncio.Queue, **kwargs) -> List[Dict[str, Any]]:
+        """Parses scenes while the storyboard streams, putting each finished scene on scene_queue, then None."""
+        parser = StoryboardParser(self.validate_and_fix_scene)
+        key = completion_cache_key(kwargs)
+        cached = read_cache_entry(LLM_CACHE_DIR, key, LLM_CACHE_TTL)
+        parts = []
+
+        async def deltas() -> AsyncIterator[str]:
+            if cached is not None:
+                yield cached
+            else:
+                async for delta in self._stream(**kwargs):
+                    yield delta
+
+        try:
+            async for delta in deltas():
+                parts.append(delta)
+                for scene in parser.feed(delta):
+                    scene_queue.put_nowait(self.enhance_scene_keywords(scene))
+            for scene in parser.close():
+                scene_queue.put_nowait(self.enhance_scene_keywords(scene))
+        finally:
+            # Always signal the consumer that no more scenes are coming
+            scene_queue.put_nowait(None)
+
+        response = "".join(parts)
+        logger.info(f"Raw storyboard response: {response}")
+        if cached is None and response:
+            write_cache_entry(LLM_CACHE_DIR, key, response)
+        if not parser.scenes:
+            logger.error("Failed to generate valid storyboard scenes")
+        return parser.scenes
     
     async def fetch_media_for_scenes(self, scenes: List[Dict[str, Any]]):
-        temp_dir = tempfile.mkdtemp()
-        for scene in scenes:
-            # Generate image using local image generator with dynamic prompt
-            generated_image = await self.generate_local_image(scene)
+        temp_dir = await run_in_thread(tempfile.mkdtemp)
+
+        generated_images = await self.generate_local_images_batch(scenes)
+        semaphore = await intermediate_encode_semaphore()
+
+        async def create_clip(scene: Dict[str, Any], generated_image: str):
+            scene["image_path"] = generated_image
+            # Create video clip from the image
+            async with semaphore:
+                video_clip = await create_video_from_image(generated_image, temp_dir, scene['number'], scene.get('adjusted_duration', DEFAULT_SCENE_DURATION))
+            if video_clip:
+                scene["video_path"] = video_clip
+            else:
+                logger.warning(f"Failed to create video clip for scene {scene['number']}")
+
+        clip_tasks = []
+        for scene, generated_image in zip(scenes, generated_images):
             if generated_image:
-                scene["image_path"] = generated_image
-                # Create video clip from the image
-                video_clip = self.create_video_from_image(generated_image, temp_dir, scene['number'], scene.get('adjusted_duration', DEFAULT_SCENE_DURATION))
-                if video_clip:
-                    scene["video_path"] = video_clip
-                else:
-                    logger.warning(f"Failed to create video clip for scene {scene['number']}")
+                clip_tasks.append(create_clip(scene, generated_image))
             else:
                 logger.warning(f"Failed to generate image for scene {scene['number']}")
+        await asyncio.gather(*clip_tasks)
 
     async def generate_local_image(self, scene: Dict[str, Any]) -> Optional[str]:
         """Generate an image using the local image generator."""
+        return (await self.generate_local_images_batch([scene]))[0]
+
+    async def generate_local_images_batch(self, scenes: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Generate images for all scenes in a single image generation run."""
         try:
-            image_gen_input = {"scene": scene}
-            image_gen_result = await self.image_generation_agent.execute(image_gen_input)
+            image_gen_results = await self.image_generation_agent.execute({"scenes": scenes})
+        except Exception as e:
+            logger.error(f"Error in local image generation: {str(e)}")
+            return [None] * len(scenes)
+
+        image_paths = []
+        for scene, image_gen_result in zip(scenes, image_gen_results):
             if image_gen_result and 'image_path' in image_gen_result:
-                return image_gen_result['image_path']
+                image_paths.append(image_gen_result['image_path'])
             else:
                 logger.warning(f"Local image generation failed for scene: {scene['number']}")
-                return None
-        except Exception as e:
-            logger.error(f"Error in local image generation: {str(e)}")
-            return None
+                image_paths.append(None)
+        return image_paths
     
     def parse_scenes(self, response: str) -> List[Dict[str, Any]]:
-        scenes = []
-        current_scene = {}
-        current_scene_number = None
-
-        for line in response.split('\n'):
-            line = line.strip()
-            logger.debug(f"Processing line: {line}")
-
-            if line.startswith(tuple(f"{i}." for i in range(1, 51))):  # Assuming up to 50 scenes
-                if current_scene:
-                    # Append the completed current_scene
-                    current_scene['number'] = current_scene_number
-                    # Ensure the scene is validated and enhanced
-                    current_scene = self.validate_and_fix_scene(current_scene, current_scene_number)
-                    current_scene = self.enhance_scene_keywords(current_scene)
-                    scenes.append(current_scene)
-                    logger.debug(f"Scene {current_scene_number} appended to scenes list")
-                    current_scene = {}
+        parser = StoryboardParser(self.validate_and_fix_scene)
+        parser.feed(response)
+        parser.close()
+        scenes = parser.scenes
 
-                try:
-                    # Start a new scene
-                    current_scene_number = int(line.split('.', 1)[0])
-                    logger.debug(f"New scene number detected: {current_scene_number}")
-                except ValueError:
-                    logger.warning(f"Invalid scene number format: {line}")
-                    continue  # Skip this line and move to the next
-            elif ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip().lower()
-                value = value.strip()
-                current_scene[key] = value
-                logger.debug(f"Key-value pair added to current scene: {key}:{value}")
-            else:
-                logger.warning(f"Line format not recognized: {line}")
-
-        # After looping through all lines, check if there is an unfinished scene
-        if current_scene:
-            current_scene['number'] = current_scene_number
-            current_scene = self.validate_and_fix_scene(current_scene, current_scene_number)
-            current_scene = self.enhance_scene_keywords(current_scene)
-            scenes.append(current_scene)
-            logger.debug(f"Final scene {current_scene_number} appended to scenes list")
+        # Enhance every scene's keywords in one batched spaCy pass
+        self.enhance_scenes_keywords(scenes)
 
         logger.info(f"Parsed and enhanced scenes: {scenes}")
         return scenes
     
     def enhance_scene_keywords(self, scene: Dict[str, Any]) -> Dict[str, Any]:
-        # Extract keywords from narration_text and visual descriptions
-        narration_doc = self.nlp(scene.get('narration_text', ''))
-        visual_doc = self.nlp(scene.get('visual', ''))
+        return self.enhance_scenes_keywords([scene])[0]
+
+    def enhance_scenes_keywords(self, scenes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Extract keywords from narration_text and visual descriptions, two docs per scene
+        texts = []
+        for scene in scenes:
+            texts.append(scene.get('narration_text', ''))
+            texts.append(scene.get('visual', ''))
+        docs = iter(self.nlp.pipe(texts, batch_size=32))
 
         # Function to extract nouns and named entities
         def extract_keywords(doc):
-            return [token.lemma_ for token in doc if token.pos_ in ('NOUN', 'PROPN') or token.ent_type_]
+            return [token.lemma_ for token in doc if token.pos_ in _KEEP_POS or token.ent_type_]
 
-        narration_keywords = extract_keywords(narration_doc)
-        visual_keywords = extract_keywords(visual_doc)
+        for scene in scenes:
+            narration_doc, visual_doc = next(docs), next(docs)
+            narration_keywords = extract_keywords(narration_doc)
+            visual_keywords = extract_keywords(visual_doc)
 
-        # Combine and deduplicate keywords
-        combined_keywords = list(set(narration_keywords + visual_keywords))
+            # Combine and deduplicate keywords, keeping first-seen order so the top 5 are stable
+            combined_keywords = list(dict.fromkeys(narration_keywords + visual_keywords))
 
-        # Generate enhanced video and image keywords
-        scene['video_keyword'] = ' '.join(combined_keywords[:5])  # Use top 5 keywords
-        scene['image_keyword'] = scene['video_keyword']
+            # Generate enhanced video and image keywords
+            scene['video_keyword'] = ' '.join(combined_keywords[:5])  # Use top 5 keywords
+            scene['image_keyword'] = scene['video_keyword']
 
-        return scene
+        return scenes
 
     def validate_and_fix_scene(self, scene: Dict[str, Any], scene_number: int) -> Dict[str, Any]:
         # Ensure 'number' key is present in the scene dictionary
@@ -905,12 +1298,14 @@ Please ensure each scene has all four elements (Visual, Text, Video Keyword, and
 
         return relevance
 
+    def rank_scenes(self, texts: List[str]) -> np.ndarray:
+        """Returns the NxN cosine similarity matrix of texts from a single TF-IDF fit."""
+        matrix = TfidfVectorizer().fit_transform(texts)
+        return cosine_similarity(matrix)
+
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculates the cosine similarity between two texts."""
-        vectorizer = TfidfVectorizer().fit_transform([text1, text2])
-        vectors = vectorizer.toarray()
-        cos_sim = cosine_similarity([vectors[0]], [vectors[1]])[0][0]
-        return cos_sim
+        return self.rank_scenes([text1, text2])[0, 1]
 
     def fallback_scene_generation(self, invalid_scenes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         valid_scenes = []
@@ -926,23 +1321,95 @@ Please ensure each scene has all four elements (Visual, Text, Video Keyword, and
             valid_scenes.append(scene)
         return valid_scenes
 
-def compile_youtube_short(scenes: List[Dict[str, Any]], audio_file: str) -> str:
+@functools.lru_cache(maxsize=None)
+def ffmpeg_encoder_works(*encoder_args: str) -> bool:
+    """Checks that ffmpeg lists an encoder and can actually encode with exactly these arguments on this machine."""
+    encoder = encoder_args[encoder_args.index('-c:v') + 1]
+    try:
+        listing = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'], capture_output=True, text=True)
+        if encoder not in listing.stdout:
+            return False
+        # Hardware encoders are listed even without a usable device, and presets such as NVENC's p1-p7
+        # need a newer SDK than a bare encode, so try a tiny encode with the real arguments
+        probe = subprocess.run(['ffmpeg', '-hide_banner', '-loglevel', 'error',
+                                '-f', 'lavfi', '-i', 'color=c=black:s=256x256:d=0.1',
+                                *encoder_args, '-pix_fmt', 'yuv420p', '-f', 'null', '-'],
+                               capture_output=True, text=True)
+        return probe.returncode == 0
+    except Exception as e:
+        logger.warning(f"Error probing ffmpeg encoder {encoder}: {str(e)}")
+        return False
+
+async def run_ffmpeg(command: List[str]) -> None:
+    """Runs an ffmpeg command without blocking the event loop, raising CalledProcessError on failure."""
+    # Only errors are printed, and they are read back only when the command fails
+    command = [command[0], '-hide_banner', '-loglevel', 'error', *command[1:]]
+    process = await asyncio.create_subprocess_exec(*command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    _, stderr = await process.communicate()
+    if process.returncode != 0:
+        stderr = stderr.decode('utf-8', errors='ignore')
+        logger.error(f"FFmpeg exited with code {process.returncode}:\n{stderr}")
+        raise subprocess.CalledProcessError(process.returncode, command, stderr=stderr)
+
+@functools.lru_cache(maxsize=1)
+def get_video_encoder_args() -> List[str]:
+    """Returns the ffmpeg video encoder arguments for the final render, preferring a hardware encoder."""
+    if ffmpeg_encoder_works(*NVENC_RENDER_ARGS):
+        logger.info("Using NVENC hardware encoder for the final render")
+        return list(NVENC_RENDER_ARGS)
+    if ffmpeg_encoder_works(*VIDEOTOOLBOX_RENDER_ARGS):
+        logger.info("Using VideoToolbox hardware encoder for the final render")
+        return list(VIDEOTOOLBOX_RENDER_ARGS)
+    return list(SOFTWARE_RENDER_ARGS)
+
+@functools.lru_cache(maxsize=1)
+def get_intermediate_encoder_args() -> List[str]:
+    """Returns the ffmpeg video encoder arguments for per-scene clips, which are re-encoded by the final render."""
+    if ffmpeg_encoder_works(*NVENC_INTERMEDIATE_ARGS):
+        return list(NVENC_INTERMEDIATE_ARGS)
+    return list(SOFTWARE_INTERMEDIATE_ARGS)
+
+async def intermediate_encode_semaphore() -> asyncio.Semaphore:
+    """Returns a semaphore sized for the per-scene encoder, probing it off the event loop on first use."""
+    encoder_args = await run_in_thread(get_intermediate_encoder_args)
+    return asyncio.Semaphore(NVENC_CONCURRENCY if encoder_args == list(NVENC_INTERMEDIATE_ARGS) else FFMPEG_CONCURRENCY)
+
+async def run_render(command: List[str]) -> None:
+    """Runs the final render, retrying once with libx264 if the hardware encoder fails mid-render."""
+    encoder_args = get_video_encoder_args()
+    try:
+        await run_ffmpeg(command)
+    except subprocess.CalledProcessError:
+        if encoder_args == list(SOFTWARE_RENDER_ARGS):
+            raise
+        logger.warning(f"Hardware render with {encoder_args[1]} failed, retrying with libx264")
+        start = next(i for i in range(len(command)) if command[i:i + len(encoder_args)] == encoder_args)
+        await run_ffmpeg(command[:start] + list(SOFTWARE_RENDER_ARGS) + command[start + len(encoder_args):])
+
+async def compile_youtube_short(scenes: List[Dict[str, Any]], audio_file: str,
+                                session: Optional[aiohttp.ClientSession] = None,
+                                output_path: Optional[str] = None) -> str:
     """Compiles the YouTube Short using ffmpeg."""
     if not scenes:
         logger.error("No scenes were generated. Cannot compile YouTube Short.")
         return None
 
-    temp_dir = tempfile.mkdtemp()
+    temp_dir = await run_in_thread(tempfile.mkdtemp)
     scene_files = []
     subtitle_file = os.path.join(temp_dir, "subtitles.srt")
     concat_file = os.path.join(temp_dir, 'concat.txt')
-    output_path = os.path.join(os.getcwd(), "youtube_short.mp4")
+    output_path = output_path or os.path.join(os.getcwd(), "youtube_short.mp4")
 
     try:
-        if not generate_voiceover(scenes, audio_file):
+        # Encoder probing runs ffmpeg synchronously, so do it once off the event loop before any command is built
+        await run_in_thread(get_video_encoder_args)
+        await run_in_thread(get_intermediate_encoder_args)
+
+        # The workflow normally renders the voiceover already; only generate it when missing
+        if not os.path.exists(audio_file) and not await generate_voiceover(scenes, audio_file):
             raise Exception("Failed to generate voiceover")
 
-        if not generate_subtitles(scenes, subtitle_file, audio_file):
+        if not await generate_subtitles(scenes, subtitle_file, audio_file, session):
             raise Exception("Failed to generate subtitles")
 
         # Collect total audio duration and adjust scene durations before processing scenes
@@ -967,61 +1434,67 @@ def compile_youtube_short(scenes: List[Dict[str, Any]], audio_file: str) -> str:
             for scene in scenes:
                 scene['adjusted_duration'] = scene.get('audio_duration', DEFAULT_SCENE_DURATION)
 
-        # Now process each scene using the adjusted durations
-        for i, scene in enumerate(scenes):
-            duration = scene.get('adjusted_duration', scene.get('audio_duration', DEFAULT_SCENE_DURATION))
-            logger.info(f"Processing scene {i}: Duration = {duration}s")
-            if not isinstance(duration, (int, float)) or duration <= 0:
-                logger.warning(f"Scene {i} has invalid duration ({duration}), skipping")
-                continue
-
-            processed_path = None
-            try:
-                if i == 0 and 'image_path' in scene:
-                    # Apply effects to the generated image
-                    processed_path = apply_effects_to_image(scene['image_path'], temp_dir, i, duration)
-                elif 'video_path' in scene and os.path.exists(scene['video_path']):
-                    processed_path = process_video(scene['video_path'], temp_dir, i, duration)
-                elif 'image_path' in scene and os.path.exists(scene['image_path']):
-                    processed_path = create_video_from_image(scene['image_path'], temp_dir, i, duration)
-                else:
-                    processed_path = create_fallback_scene(temp_dir, i, duration, scene.get('narration_text', ''))
-
-                if processed_path and os.path.exists(processed_path):
-                    scene_files.append(processed_path)
-                else:
-                    logger.error(f"Failed to process media for scene {i}")
-            except Exception as e:
-                logger.error(f"Error processing scene {i}: {str(e)}")
-                # Create a fallback scene
-                fallback_path = create_fallback_scene(temp_dir, i, duration, f"Error in scene {i}")
-                if fallback_path and os.path.exists(fallback_path):
-                    scene_files.append(fallback_path)
-
-        # Create concat.txt file
-        with open(concat_file, 'w') as f:
-            for file in scene_files:
-                f.write(f"file '{file}'\n")
-
-        with open(concat_file, 'r') as f:
-            concat_contents = f.read()
+        # When every scene is a still image, build the whole short in one ffmpeg pass
+        ffmpeg_command = build_single_pass_command(scenes, audio_file, subtitle_file, output_path)
+        if ffmpeg_command:
+            logger.info("Rendering all scenes in a single ffmpeg pass")
+        else:
+            # Now process each scene using the adjusted durations, encoding independent scenes concurrently
+            semaphore = await intermediate_encode_semaphore()
+
+            async def process_scene(i: int, scene: Dict[str, Any]) -> Optional[str]:
+                duration = scene.get('adjusted_duration', scene.get('audio_duration', DEFAULT_SCENE_DURATION))
+                logger.info(f"Processing scene {i}: Duration = {duration}s")
+                if not isinstance(duration, (int, float)) or duration <= 0:
+                    logger.warning(f"Scene {i} has invalid duration ({duration}), skipping")
+                    return None
+
+                async with semaphore:
+                    processed_path = None
+                    try:
+                        if i == 0 and 'image_path' in scene:
+                            # Apply effects to the generated image
+                            processed_path = await apply_effects_to_image(scene['image_path'], temp_dir, i, duration)
+                        elif 'video_path' in scene and os.path.exists(scene['video_path']):
+                            processed_path = await process_video(scene['video_path'], temp_dir, i, duration)
+                        elif 'image_path' in scene and os.path.exists(scene['image_path']):
+                            processed_path = await create_video_from_image(scene['image_path'], temp_dir, i, duration)
+                        else:
+                            processed_path = await create_fallback_scene(temp_dir, i, duration, scene.get('narration_text', ''))
+
+                        if processed_path and os.path.exists(processed_path):
+                            return processed_path
+                        logger.error(f"Failed to process media for scene {i}")
+                    except Exception as e:
+                        logger.error(f"Error processing scene {i}: {str(e)}")
+                        # Create a fallback scene
+                        fallback_path = await create_fallback_scene(temp_dir, i, duration, f"Error in scene {i}")
+                        if fallback_path and os.path.exists(fallback_path):
+                            return fallback_path
+                    return None
+
+            processed_paths = await asyncio.gather(*[process_scene(i, scene) for i, scene in enumerate(scenes)])
+            scene_files.extend(path for path in processed_paths if path)
+
+            # Create concat.txt file
+            concat_contents = ''.join(f"file '{file}'\n" for file in scene_files)
+            with open(concat_file, 'w') as f:
+                f.write(concat_contents)
             logger.info(f"Contents of concat file:\n{concat_contents}")
 
-        ffmpeg_command = [
-            'ffmpeg', '-y',
-            '-f', 'concat', '-safe', '0', '-i', concat_file,
-            '-i', audio_file,
-            '-r', '30',
-            '-vf', f"subtitles='{subtitle_file}':force_style='FontSize={SUBTITLE_FONT_SIZE},Alignment={SUBTITLE_ALIGNMENT},"
-            f"OutlineColour={SUBTITLE_OUTLINE_COLOR},BorderStyle={SUBTITLE_BORDER_STYLE}'",
-            '-map', '0:v',
-            '-map', '1:a',
-            '-c:v', 'libx264', '-preset', 'ultrafast',
-            '-c:a', 'aac', '-shortest',
-            output_path
-        ]
+            ffmpeg_command = [
+                'ffmpeg', '-y',
+                '-f', 'concat', '-safe', '0', '-i', concat_file,
+                '-i', audio_file,
+                '-vf', f"fps={SCENE_FPS},{subtitles_filter(subtitle_file)}",
+                '-map', '0:v',
+                '-map', '1:a',
+                *get_video_encoder_args(), '-pix_fmt', 'yuv420p',
+                '-c:a', 'aac', '-b:a', '128k', '-shortest', '-movflags', '+faststart',
+                output_path
+            ]
         logger.info(f"Running FFmpeg command: {' '.join(ffmpeg_command)}")
-        subprocess.run(ffmpeg_command, check=True)
+        await run_render(ffmpeg_command)
 
         if os.path.exists(output_path):
             logger.info(f"YouTube Short compiled successfully: {output_path}")
@@ -1051,11 +1524,58 @@ def compile_youtube_short(scenes: List[Dict[str, Any]], audio_file: str) -> str:
             logger.warning(f"Error removing temporary files: {str(e)}")
 
         try:
-            shutil.rmtree(temp_dir)
+            await run_in_thread(shutil.rmtree, temp_dir)
         except Exception as e:
             logger.warning(f"Error removing temporary directory {temp_dir}: {str(e)}")
             
-def apply_effects_to_image(image_path: str, temp_dir: str, scene_number: int, duration: float) -> str:
+def subtitles_filter(subtitle_file: str) -> str:
+    """Returns the ffmpeg filter that burns the styled subtitles into the video."""
+    return (f"subtitles='{subtitle_file}':force_style='FontSize={SUBTITLE_FONT_SIZE},Alignment={SUBTITLE_ALIGNMENT},"
+            f"OutlineColour={SUBTITLE_OUTLINE_COLOR},BorderStyle={SUBTITLE_BORDER_STYLE}'")
+
+def build_single_pass_command(scenes: List[Dict[str, Any]], audio_file: str, subtitle_file: str,
+                              output_path: str) -> Optional[List[str]]:
+    """
+    Builds one ffmpeg command that scales, concatenates and subtitles every scene image and muxes the audio.
+    Returns None when any scene needs the per-scene path (video clips, missing images or bad durations).
+    """
+    inputs = []
+    chains = []
+    for i, scene in enumerate(scenes):
+        duration = scene.get('adjusted_duration', scene.get('audio_duration', DEFAULT_SCENE_DURATION))
+        image_path = scene.get('image_path')
+        if ('video_path' in scene or not image_path or not os.path.exists(image_path)
+                or not isinstance(duration, (int, float)) or duration <= 0):
+            return None
+        if i == 0:
+            # zoompan emits d frames per input frame, so feed it the single still frame
+            frames = max(1, round(duration * SCENE_FPS))
+            inputs += ['-i', image_path]
+            chains.append(f"[{i}:v]zoompan=z='min(zoom+0.0015,1.5)':d={frames}:"
+                          f"s={YOUTUBE_SHORT_RESOLUTION[0]}x{YOUTUBE_SHORT_RESOLUTION[1]}:fps={SCENE_FPS},"
+                          f"{SCENE_NORMALIZE_FILTER}[v{i}]")
+        else:
+            inputs += ['-loop', '1', '-t', str(duration), '-i', image_path]
+            chains.append(f"[{i}:v]{SCENE_SCALE_FILTER},{SCENE_NORMALIZE_FILTER}[v{i}]")
+
+    if not inputs:
+        return None
+    labels = ''.join(f"[v{i}]" for i in range(len(scenes)))
+    chains.append(f"{labels}concat=n={len(scenes)}:v=1:a=0[vcat]")
+    chains.append(f"[vcat]{subtitles_filter(subtitle_file)}[vout]")
+    return [
+        'ffmpeg', '-y',
+        *inputs,
+        '-i', audio_file,
+        '-filter_complex', ';'.join(chains),
+        '-map', '[vout]',
+        '-map', f'{len(scenes)}:a',
+        *get_video_encoder_args(), '-pix_fmt', 'yuv420p',
+        '-c:a', 'aac', '-b:a', '128k', '-shortest', '-movflags', '+faststart',
+        output_path
+    ]
+
+async def apply_effects_to_image(image_path: str, temp_dir: str, scene_number: int, duration: float) -> str:
     """Applies effects to the generated image and creates a video scene."""
     try:
         processed_path = os.path.join(temp_dir, f"processed_scene_{scene_number}.mp4")
@@ -1065,25 +1585,24 @@ def apply_effects_to_image(image_path: str, temp_dir: str, scene_number: int, du
             '-loop', '1',
             '-i', image_path,
             '-t', str(duration),
-            '-filter_complex', f'zoompan=z=\'min(zoom+0.0015,1.5)\':d={duration*30}:s={YOUTUBE_SHORT_RESOLUTION[0]}x{YOUTUBE_SHORT_RESOLUTION[1]}',
-            '-c:v', 'libx264', '-pix_fmt', 'yuv420p', '-r', '30',
+            '-filter_complex', f'zoompan=z=\'min(zoom+0.0015,1.5)\':d={duration*30}:s={YOUTUBE_SHORT_RESOLUTION[0]}x{YOUTUBE_SHORT_RESOLUTION[1]}:fps={SCENE_FPS},'
+                               f'{SCENE_NORMALIZE_FILTER}',
+            *get_intermediate_encoder_args(),
             processed_path
         ]
-        subprocess.run(ffmpeg_command, check=True)
+        await run_ffmpeg(ffmpeg_command)
         return processed_path
     except Exception as e:
         logger.error(f"Error applying effects to generated image for scene {scene_number}: {str(e)}")
         return None
     
-def create_video_from_image(image_path: str, temp_dir: str, scene_number: int, duration: float) -> str:
+async def create_video_from_image(image_path: str, temp_dir: str, scene_number: int, duration: float) -> str:
     """Creates a video scene from a static image."""
     try:
         processed_path = os.path.join(temp_dir, f"processed_scene_{scene_number}.mp4")
-        subprocess.run(['ffmpeg', '-y', '-loop', '1', '-i', image_path, '-t', str(duration),
-                        '-r', '30',
-                        '-vf', f'scale={YOUTUBE_SHORT_RESOLUTION[0]}:{YOUTUBE_SHORT_RESOLUTION[1]}:force_original_aspect_ratio=increase,crop={YOUTUBE_SHORT_RESOLUTION[0]}:{YOUTUBE_SHORT_RESOLUTION[1]}',
-                        '-c:v', 'libx264', '-preset', 'ultrafast', '-an', processed_path],
-                       check=True)
+        await run_ffmpeg(['ffmpeg', '-y', '-loop', '1', '-i', image_path, '-t', str(duration),
+                          '-vf', f'{SCENE_SCALE_FILTER},{SCENE_NORMALIZE_FILTER}',
+                          *get_intermediate_encoder_args(), '-an', processed_path])
         return processed_path
     except Exception as e:
         logger.error(f"Error creating video from image for scene {scene_number}: {str(e)}")
@@ -1104,7 +1623,81 @@ def clean_text_for_tts(text: str) -> str:
     text = ' '.join(text.split())
     return text
 
-def generate_voiceover(scenes: List[Dict[str, Any]], output_file: str) -> bool:
+def tts_cache_key(voice: str, text: str) -> str:
+    """Returns the TTS cache key for a voice and cleaned text; the mp3 is stored next to its duration entry."""
+    return hashlib.sha1(f"{voice}:{text}".encode('utf-8')).hexdigest()
+
+def load_tts_cache(key: str, audio_file: str) -> Optional[float]:
+    """Copies a cached voiceover to audio_file and returns its duration, or None if the entry is missing or unreadable."""
+    duration = read_cache_entry(TTS_CACHE_DIR, key, TTS_CACHE_TTL)
+    if not isinstance(duration, (int, float)) or duration <= 0:
+        return None
+    try:
+        shutil.copy(os.path.join(TTS_CACHE_DIR, f"{key}.mp3"), audio_file)
+    except OSError:
+        return None
+    return duration
+
+def store_tts_cache(key: str, audio_file: str, duration: float) -> None:
+    """Copies a freshly generated voiceover into the TTS cache."""
+    cached_audio_file = os.path.join(TTS_CACHE_DIR, f"{key}.mp3")
+    try:
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cached_audio_file}.{os.getpid()}.tmp"
+        shutil.copy(audio_file, tmp_path)
+        os.replace(tmp_path, cached_audio_file)
+    except OSError as e:
+        logger.warning(f"Could not cache voiceover {audio_file}: {str(e)}")
+        return
+    # The duration entry is written last, so its presence marks a complete entry
+    write_cache_entry(TTS_CACHE_DIR, key, duration)
+
+async def generate_scene_voiceover(i: int, scene: Dict[str, Any], temp_dir: str,
+                                   semaphore: asyncio.Semaphore) -> Optional[str]:
+    """Synthesizes one scene's narration into temp_dir and records the audio file and duration on the scene."""
+    text = scene.get('narration_text', '').strip()
+    if not text or text.lower() == 'none':
+        return None
+    # Clean up the text to remove unwanted punctuation or characters
+    text = clean_text_for_tts(text)
+    scene_audio_file = os.path.join(temp_dir, f"scene_{i}.mp3")
+    cache_key = tts_cache_key(TTS_VOICE, text)
+    duration = load_tts_cache(cache_key, scene_audio_file)
+    if duration is not None:
+        logger.info(f"Using cached voiceover for scene {i}")
+    else:
+        logger.info(f"Generating voiceover for scene {i}")
+        async with semaphore:
+            await run_in_thread(tts, text=text, voice=TTS_VOICE, filename=scene_audio_file)
+        if not os.path.exists(scene_audio_file):
+            raise Exception(f"Failed to generate audio for scene {i}")
+        # Get duration of audio
+        duration = await probe_audio_duration(scene_audio_file)
+        # A failed probe reports 0s; caching that would mis-size this narration on every later run
+        if duration > 0:
+            store_tts_cache(cache_key, scene_audio_file, duration)
+    scene['audio_file'] = scene_audio_file  # Store the audio file path in scene
+    scene['audio_duration'] = duration      # Store the duration
+    logger.info(f"Scene {i}: Audio duration = {duration}s")
+    return scene_audio_file
+
+async def concat_audio(audio_files: List[str], output_file: str, temp_dir: str) -> None:
+    """Joins the per-scene mp3 files into output_file without re-encoding."""
+    concat_file = os.path.join(temp_dir, 'audio_concat.txt')
+    with open(concat_file, 'w') as f:
+        for file in audio_files:
+            f.write(f"file '{file}'\n")
+    try:
+        await run_ffmpeg(['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', concat_file,
+                          '-c', 'copy', output_file])
+    except subprocess.CalledProcessError as e:
+        # Stream copy needs matching sample rates and channels; otherwise decode once and encode once
+        logger.warning(f"Stream-copy audio concat failed, re-encoding instead: {str(e)}")
+        await run_ffmpeg(['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', concat_file,
+                          '-c:a', 'libmp3lame', '-b:a', '128k', output_file])
+    logger.info(f"Combined voiceover saved to {output_file}")
+
+async def generate_voiceover(scenes: List[Dict[str, Any]], output_file: str) -> bool:
     """Generates per-scene voiceover from scene narrations using tiktokvoice."""
     if not scenes:
         logger.error("No scenes provided for voiceover generation.")
@@ -1112,51 +1705,35 @@ def generate_voiceover(scenes: List[Dict[str, Any]], output_file: str) -> bool:
 
     logger.info(f"Total number of scenes: {len(scenes)}")
 
-    temp_dir = tempfile.mkdtemp()
-    audio_segments = []
+    temp_dir = await run_in_thread(tempfile.mkdtemp)
+    # Bound concurrent TTS requests to stay within the service's rate limit
+    semaphore = asyncio.Semaphore(TTS_CONCURRENCY)
+
     try:
-        for i, scene in enumerate(scenes):
-            text = scene.get('narration_text', '').strip()
-            if not text or text.lower() == 'none':
-                continue
-            # Clean up the text to remove unwanted punctuation or characters
-            text = clean_text_for_tts(text)
-            scene_audio_file = os.path.join(temp_dir, f"scene_{i}.mp3")
-            logger.info(f"Generating voiceover for scene {i}")
-            tts(text=text, voice="en_uk_003", filename=scene_audio_file)
-            if os.path.exists(scene_audio_file):
-                # Get duration of audio
-                audio_segment = AudioSegment.from_mp3(scene_audio_file)
-                duration = audio_segment.duration_seconds  # provides a float value in seconds
-                scene['audio_file'] = scene_audio_file  # Store the audio file path in scene
-                scene['audio_duration'] = duration      # Store the duration
-                audio_segments.append(audio_segment)
-                logger.info(f"Scene {i}: Audio duration = {duration}s")
-            else:
-                logger.error(f"Failed to generate audio for scene {i}")
-                return False
+        results = await asyncio.gather(*[generate_scene_voiceover(i, scene, temp_dir, semaphore)
+                                         for i, scene in enumerate(scenes)])
+        audio_files = [file for file in results if file]
 
-        if not audio_segments:
+        if not audio_files:
             logger.error("No audio segments were generated.")
             return False
 
-        # Combine all audio segments into one file
-        combined_audio = sum(audio_segments)
-        combined_audio.export(output_file, format='mp3')
-        logger.info(f"Combined voiceover saved to {output_file}")
+        # Combine all audio segments into one file without re-encoding
+        await concat_audio(audio_files, output_file, temp_dir)
         return True
     except Exception as e:
         logger.error(f"Error generating voiceover: {str(e)}")
         return False
     finally:
         try:
-            shutil.rmtree(temp_dir)
+            await run_in_thread(shutil.rmtree, temp_dir)
         except Exception as e:
             logger.warning(f"Error removing temporary directory {temp_dir}: {str(e)}")
 
-def generate_subtitles(scenes: List[Dict[str, Any]], output_file: str, audio_file: str) -> bool:
+async def generate_subtitles(scenes: List[Dict[str, Any]], output_file: str, audio_file: str,
+                             session: Optional[aiohttp.ClientSession] = None) -> bool:
     try:
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = await run_in_thread(tempfile.mkdtemp)
         input_text_file = os.path.join(temp_dir, "input_text.txt")
         with open(input_text_file, "w", encoding="utf-8") as f:
             for scene in scenes:
@@ -1165,33 +1742,30 @@ def generate_subtitles(scenes: List[Dict[str, Any]], output_file: str, audio_fil
                     f.write(text + " ")
 
         # Align using Gentle
-        alignment_result = align_with_gentle(audio_file, input_text_file)
+        alignment_result = await align_with_gentle(audio_file, input_text_file, session)
         if not alignment_result:
             raise Exception("Alignment failed with Gentle.")
 
         # Convert alignment result to SRT
         gentle_alignment_to_srt(alignment_result, output_file)
 
-        shutil.rmtree(temp_dir)
+        await run_in_thread(shutil.rmtree, temp_dir)
         return True
     except Exception as e:
         logger.error(f"Error generating subtitles: {str(e)}")
         return False
 
-def calculate_scene_durations(scenes: List[Dict[str, Any]], audio_segments: List[AudioSegment]) -> List[float]:
+def calculate_scene_durations(scenes: List[Dict[str, Any]], audio_files: List[str]) -> List[float]:
     """
     Calculates the duration of each scene based on the actual duration of the corresponding narration audio.
     """
     if not scenes:
         logger.error("No scene durations calculated. Cannot calculate scene durations.")
         return None
-    scene_durations = []
-    for segment in audio_segments:
-        duration = len(segment) / 1000  # Convert milliseconds to seconds
-        scene_durations.append(duration)
-    return scene_durations
+    # ffprobe reads the container header instead of decoding the mp3 to PCM
+    return [get_audio_duration(audio_file) for audio_file in audio_files]
             
-def process_video(video_path: str, temp_dir: str, scene_number: int, duration: float) -> Optional[str]:
+async def process_video(video_path: str, temp_dir: str, scene_number: int, duration: float) -> Optional[str]:
     try:
         processed_path = os.path.join(temp_dir, f"processed_scene_{scene_number}.mp4")
         duration_str = str(duration)
@@ -1200,14 +1774,12 @@ def process_video(video_path: str, temp_dir: str, scene_number: int, duration: f
             'ffmpeg', '-y',
             '-i', video_path,
             '-t', duration_str,
-            '-vf', f'scale={YOUTUBE_SHORT_RESOLUTION[0]}:{YOUTUBE_SHORT_RESOLUTION[1]}:force_original_aspect_ratio=increase,crop={YOUTUBE_SHORT_RESOLUTION[0]}:{YOUTUBE_SHORT_RESOLUTION[1]}',
-            '-c:v', 'libx264',
-            '-preset', 'fast',
-            '-r', '30',
+            '-vf', f'{SCENE_SCALE_FILTER},{SCENE_NORMALIZE_FILTER}',
+            *get_intermediate_encoder_args(),
             '-an',
             processed_path
         ]
-        subprocess.run(ffmpeg_command, check=True)
+        await run_ffmpeg(ffmpeg_command)
         if os.path.exists(processed_path):
             logger.info(f"Processed video saved: {processed_path}")
             return processed_path
@@ -1218,7 +1790,7 @@ def process_video(video_path: str, temp_dir: str, scene_number: int, duration: f
         logger.error(f"Error processing video for scene {scene_number}: {str(e)}")
         return None
     
-def create_fallback_scene(temp_dir: str, scene_number: int, duration: float, text: str) -> str:
+async def create_fallback_scene(temp_dir: str, scene_number: int, duration: float, text: str) -> str:
     """Creates a fallback scene with a colored background and text."""
     try:
         fallback_path = os.path.join(temp_dir, f"fallback_scene_{scene_number}.mp4")
@@ -1230,32 +1802,24 @@ def create_fallback_scene(temp_dir: str, scene_number: int, duration: float, tex
             '-i', f'color=c={FALLBACK_SCENE_COLOR}:s={YOUTUBE_SHORT_RESOLUTION[0]}x{YOUTUBE_SHORT_RESOLUTION[1]}:d={duration}',
             '-vf', f"drawtext=fontfile={FALLBACK_SCENE_FONT_FILE}:fontsize={FALLBACK_SCENE_FONT_SIZE}:"
                    f"fontcolor={FALLBACK_SCENE_TEXT_COLOR}:box=1:boxcolor={FALLBACK_SCENE_BOX_COLOR}:"
-                   f"boxborderw={FALLBACK_SCENE_BOX_BORDER_WIDTH}:x=(w-tw)/2:y=(h-th)/2:text='{escaped_text}'",
-            '-c:v', 'libx265', '-preset', 'ultrafast', '-an',
+                   f"boxborderw={FALLBACK_SCENE_BOX_BORDER_WIDTH}:x=(w-tw)/2:y=(h-th)/2:text='{escaped_text}',"
+                   f"{SCENE_NORMALIZE_FILTER}",
+            # Always encode in software so the fallback still works when the hardware encoder is what failed
+            *SOFTWARE_INTERMEDIATE_ARGS, '-an',
             fallback_path
         ]
         
         # Log the full ffmpeg command
         logger.debug(f"Fallback scene FFmpeg command: {' '.join(ffmpeg_command)}")
         
-        # Run ffmpeg command and capture output
-        result = subprocess.run(ffmpeg_command, check=True, capture_output=True, text=True)
-        
-        # Log ffmpeg output
-        logger.debug(f"Fallback scene FFmpeg stdout:\n{result.stdout}")
-        logger.debug(f"Fallback scene FFmpeg stderr:\n{result.stderr}")
-        
+        await run_ffmpeg(ffmpeg_command)
         return fallback_path
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Error creating fallback scene {scene_number}: {str(e)}")
-        logger.error(f"FFmpeg stdout:\n{e.stdout}")
-        logger.error(f"FFmpeg stderr:\n{e.stderr}")
-        return None
     except Exception as e:
         logger.error(f"Error creating fallback scene {scene_number}: {str(e)}")
         return None
 
 
+@functools.lru_cache(maxsize=1024)
 def extract_selected_title(selection_output: str) -> str:
     """
     Extracts the selected title from the Title Selection Agent's output.
@@ -1274,9 +1838,24 @@ def extract_selected_title(selection_output: str) -> str:
         logger.error(f"Error extracting selected title: {str(e)}")
         return selection_output.strip()
     
+def ffprobe_duration_command(audio_file: str) -> List[str]:
+    """Builds the ffprobe command that prints an audio file's duration in seconds."""
+    return ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', audio_file]
+
+async def probe_audio_duration(audio_file: str) -> float:
+    """Reads an audio file's duration with ffprobe without blocking the event loop."""
+    try:
+        process = await asyncio.create_subprocess_exec(*ffprobe_duration_command(audio_file),
+                                                       stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        stdout, _ = await process.communicate()
+        return float(stdout)
+    except Exception as e:
+        logger.error(f"Error getting audio duration: {str(e)}")
+        return 0.0
+
 def get_audio_duration(audio_file: str) -> float:
     try:
-        result = subprocess.run(['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', audio_file], capture_output=True, text=True)
+        result = subprocess.run(ffprobe_duration_command(audio_file), capture_output=True, text=True)
         return float(result.stdout)
     except Exception as e:
         logger.error(f"Error getting audio duration: {str(e)}")
@@ -1289,20 +1868,37 @@ def main():
     st.set_page_config(page_title="YouTube Shorts Generator", page_icon="🎥", layout="wide")
     st.title("YouTube Shorts Generator")
 
+    # Load the spaCy model up front so a missing model is reported before a workflow starts
+    try:
+        get_nlp()
+    except OSError as e:
+        st.error(str(e))
+        st.stop()
+
     # Input fields
-    topic = st.text_input("Enter the topic for your YouTube video:")
+    topics_input = st.text_area("Enter the topic for your YouTube video (one per line to generate several):")
     time_frame = st.text_input("Enter the time frame for recent events (e.g., 'past week', '30d', '1y'):")
     video_length = st.number_input("Enter the desired video length in seconds:")
 
+    topics = [topic.strip() for topic in topics_input.splitlines() if topic.strip()]
+
     if st.button("Generate YouTube Shorts"):
-        if topic and time_frame:
+        if topics and time_frame:
             with st.spinner("Generating YouTube Shorts..."):
                 try:
-                    results = asyncio.run(youtube_shorts_workflow(topic, time_frame, video_length))
-                    if "Error" in results:
-                        st.error(f"An error occurred: {results['Error']}")
+                    if len(topics) == 1:
+                        results = asyncio.run(youtube_shorts_workflow(topics[0], time_frame, video_length))
+                        if "Error" in results:
+                            st.error(f"An error occurred: {results['Error']}")
+                        else:
+                            display_results(results)
                     else:
-                        display_results(results)
+                        for topic, results in zip(topics, asyncio.run(youtube_shorts_batch(topics, time_frame, video_length))):
+                            st.header(topic)
+                            if "Error" in results:
+                                st.error(f"An error occurred: {results['Error']}")
+                            else:
+                                display_results(results)
                 except Exception as e:
                     st.error(f"An unexpected error occurred: {str(e)}")
                     logger.exception("Unexpected error in YouTube Shorts generation")
@@ -1335,9 +1931,88 @@ def display_results(results):
             st.error("Failed to compile YouTube Short")
             
 async def youtube_shorts_workflow(topic: str, time_frame: str, video_length: int) -> Dict[str, Any]:
+    async with AppContext() as context:
+        return await run_youtube_shorts_workflow(context, topic, time_frame, video_length)
+
+async def youtube_shorts_batch(topics: List[str], time_frame: str, video_length: int) -> List[Dict[str, Any]]:
+    """Runs the workflow for several topics at once, so one short renders while the next is still being written."""
+    async with AppContext() as context:
+        # The topic's position keeps topics that slugify alike from overwriting each other's render
+        runs = await asyncio.gather(*[
+            run_youtube_shorts_workflow(context, topic, time_frame, video_length,
+                                        output_path=os.path.join(os.getcwd(), f"youtube_short_{i + 1}_{slugify(topic)}.mp4"))
+            for i, topic in enumerate(topics)
+        ], return_exceptions=True)
+    results = []
+    for topic, run in zip(topics, runs):
+        if isinstance(run, Exception):
+            logger.error(f"Workflow for topic {topic} failed: {str(run)}")
+            run = {"Error": str(run)}
+        results.append(run)
+    return results
+
+def slugify(text: str) -> str:
+    """Turns a topic into a short, filesystem-safe file name fragment."""
+    return re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')[:50] or "topic"
+
+async def produce_scene_media(storyboard_gen_node: Node, image_gen_agent: 'ImageGenerationAgent', script: str,
+                              temp_dir: str, tts_semaphore: asyncio.Semaphore
+                              ) -> Tuple[List[Dict[str, Any]], List[Optional[Dict[str, Any]]]]:
+    """
+    Streams the storyboard and, for every scene as soon as it is parsed, generates its image and voiceover.
+    Returns the scenes and their image results in storyboard order.
+    """
+    scene_queue = asyncio.Queue()
+    storyboard_task = asyncio.create_task(storyboard_gen_node.process({"script": script, "scene_queue": scene_queue}))
+
+    async def generate_image(i: int, scene: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        image_result = await image_gen_agent.generate_image(i, scene)
+        if image_result is not None:
+            scene['image_path'] = image_result['image_path']
+        return image_result
+
+    async def prepare_scene(i: int, scene: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        image_task = asyncio.ensure_future(generate_image(i, scene))
+        try:
+            await generate_scene_voiceover(i, scene, temp_dir, tts_semaphore)
+        except BaseException:
+            # Don't leave the image request running for a scene that has already failed
+            image_task.cancel()
+            raise
+        return await image_task
+
+    async def next_scene() -> Optional[Dict[str, Any]]:
+        """Returns the next queued scene, or None once the storyboard is done and its scenes are drained."""
+        if not storyboard_task.done():
+            getter = asyncio.ensure_future(scene_queue.get())
+            # Race the queue against the storyboard so it ending without a sentinel cannot hang the loop
+            await asyncio.wait({getter, storyboard_task}, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                return getter.result()
+            getter.cancel()
+        return None if scene_queue.empty() else scene_queue.get_nowait()
+
+    media_tasks = []
+    try:
+        while (scene := await next_scene()) is not None:
+            media_tasks.append(asyncio.create_task(prepare_scene(len(media_tasks), scene)))
+        scenes = await storyboard_task
+        image_results = await asyncio.gather(*media_tasks)
+    except BaseException:
+        storyboard_task.cancel()
+        for task in media_tasks:
+            task.cancel()
+        raise
+
+    logger.info(f"Image generation completed. Generated {len([r for r in image_results if r is not None])}/{len(scenes)} images.")
+    return scenes, list(image_results)
+
+async def run_youtube_shorts_workflow(context: AppContext, topic: str, time_frame: str, video_length: int,
+                                      output_path: Optional[str] = None) -> Dict[str, Any]:
     # Create graph instance
     graph = Graph()  # Create an instance of the Graph class
     video_length = video_length * 1000  # Convert to milliseconds
+    results = {}
     # Check if TikTok session ID is set
     if not SESSION_ID:
         logger.error("TikTok session ID is not set. Please set the TIKTOK_SESSION_ID environment variable.")
@@ -1345,13 +2020,13 @@ async def youtube_shorts_workflow(topic: str, time_frame: str, video_length: int
         return results
 
     # Create nodes
-    recent_events_node = Node(agent=RecentEventsResearchAgent())
+    recent_events_node = Node(agent=RecentEventsResearchAgent(session=context.session))
     title_gen_node = Node(agent=TitleGenerationAgent())
     title_select_node = Node(agent=TitleSelectionAgent())
     desc_gen_node = Node(agent=DescriptionGenerationAgent())
     hashtag_tag_node = Node(agent=HashtagAndTagGenerationAgent())
     script_gen_node = Node(agent=VideoScriptGenerationAgent())
-    image_gen_node = Node(agent=ImageGenerationAgent()) 
+    image_gen_node = Node(agent=ImageGenerationAgent(semaphore=context.image_semaphore)) 
     storyboard_gen_node = Node(agent=StoryboardGenerationAgent())
 
     # Add nodes to graph
@@ -1380,125 +2055,115 @@ async def youtube_shorts_workflow(topic: str, time_frame: str, video_length: int
     current_node = recent_events_node
     logger.info(f"Starting workflow from node: {current_node.agent.name}")
     input_data = {"topic": topic, "time_frame": time_frame}
-    results = {}
-    
-    # Step 1: Recent Events Research Agent
-    input_data = {"topic": topic, "time_frame": time_frame}
-    try:
-        research_result = await recent_events_node.process(input_data)
-        results[recent_events_node.agent.name] = research_result
-    except Exception as e:
-        logger.error(f"Error in RecentEventsResearchAgent: {str(e)}")
-        results["Error"] = f"RecentEventsResearchAgent failed: {str(e)}"
-        return results
 
-    # Step 2: Title Generation Agent
-    try:
-        title_gen_result = await title_gen_node.process(research_result)
-        results[title_gen_node.agent.name] = title_gen_result
-    except Exception as e:
-        logger.error(f"Error in TitleGenerationAgent: {str(e)}")
-        results["Error"] = f"TitleGenerationAgent failed: {str(e)}"
-        return results
+    async def run_step(node: Node, step_input: Any) -> Any:
+        """Runs one agent step through the cache and retries, timing it and recording its result."""
+        agent_label = type(node.agent).__name__
+        started = time.perf_counter()
+        try:
+            result = await cached_process(node, step_input)
+        except Exception as e:
+            logger.error(f"Error in {agent_label}: {str(e)}")
+            raise WorkflowStepError(f"{agent_label} failed: {str(e)}") from e
+        logger.info(f"{agent_label} finished in {time.perf_counter() - started:.2f}s")
+        results[node.agent.name] = result
+        return result
 
-    # Step 3: Title Selection Agent
+    # Steps 2 and 6 only depend on the research, so script generation runs
+    # alongside the title steps
+    script_gen_task = None
     try:
-        title_select_result = await title_select_node.process(title_gen_result)
-        results[title_select_node.agent.name] = title_select_result
-    except Exception as e:
-        logger.error(f"Error in TitleSelectionAgent: {str(e)}")
-        results["Error"] = f"TitleSelectionAgent failed: {str(e)}"
+        # Step 1: Recent Events Research Agent
+        research_result = await run_step(recent_events_node, input_data)
+
+        script_gen_input = {"research": research_result}
+        if video_length:
+            script_gen_input["video_length"] = int(video_length / 1000)
+        script_gen_task = asyncio.create_task(run_step(script_gen_node, script_gen_input))
+
+        # Step 2: Title Generation Agent
+        title_gen_result = await run_step(title_gen_node, research_result)
+
+        # Step 3: Title Selection Agent
+        title_select_result = await run_step(title_select_node, title_gen_result)
+    except WorkflowStepError as e:
+        results["Error"] = str(e)
+        if script_gen_task:
+            script_gen_task.cancel()
+            # Retrieve the outcome so a script step that already failed is not reported as unhandled
+            await asyncio.gather(script_gen_task, return_exceptions=True)
         return results
 
     # Extract the selected title from the title selection result
     selected_title = extract_selected_title(title_select_result)
     results["Selected Title"] = selected_title
 
-    # Step 4: Description Generation Agent
-    try:
-        desc_gen_result = await desc_gen_node.process(selected_title)
-        results[desc_gen_node.agent.name] = desc_gen_result
-    except Exception as e:
-        logger.error(f"Error in DescriptionGenerationAgent: {str(e)}")
-        results["Error"] = f"DescriptionGenerationAgent failed: {str(e)}"
-        return results
-
-    # Step 5: Hashtag and Tag Generation Agent
-    try:
-        hashtag_tag_result = await hashtag_tag_node.process(selected_title)
-        results[hashtag_tag_node.agent.name] = hashtag_tag_result
-    except Exception as e:
-        logger.error(f"Error in HashtagAndTagGenerationAgent: {str(e)}")
-        results["Error"] = f"HashtagAndTagGenerationAgent failed: {str(e)}"
-        return results
-
-    # Step 6: Video Script Generation Agent
-    try:
-        script_gen_input = {"research": research_result}
-        script_gen_result = await script_gen_node.process(script_gen_input)
-        results[script_gen_node.agent.name] = script_gen_result
-    except Exception as e:
-        logger.error(f"Error in VideoScriptGenerationAgent: {str(e)}")
-        results["Error"] = f"VideoScriptGenerationAgent failed: {str(e)}"
+    # Steps 4 and 5 only need the selected title and step 6 is already running, so wait for all three together
+    wave_results = await asyncio.gather(
+        run_step(desc_gen_node, selected_title),
+        run_step(hashtag_tag_node, selected_title),
+        script_gen_task,
+        return_exceptions=True,
+    )
+    errors = [str(result) for result in wave_results if isinstance(result, Exception)]
+    if errors:
+        results["Error"] = "; ".join(errors)
         return results
+    desc_gen_result, hashtag_tag_result, script_gen_result = wave_results
 
-    # Step 7: Storyboard Generation Agent
+    # Steps 7 and 8: Storyboard and Image Generation Agents. Each scene's image and voiceover
+    # start as soon as the scene is parsed from the streaming storyboard.
     logger.info("Executing Storyboard Generation Agent")
-    storyboard_gen_input = {
-        "script": script_gen_result,
-    }
-    storyboard_gen_result = await storyboard_gen_node.process(storyboard_gen_input)
+    temp_dir = await run_in_thread(tempfile.mkdtemp)
+    storyboard_gen_result, image_gen_result = await produce_scene_media(
+        storyboard_gen_node, image_gen_node.agent, script_gen_result, temp_dir, context.tts_semaphore)
     if storyboard_gen_result is None:
         raise ValueError("Storyboard Generation Agent returned None")
     results[storyboard_gen_node.agent.name] = storyboard_gen_result
-
-    # Step 8: Image Generation Agent
-    logger.info("Executing Image Generation Agent")
-    image_gen_input = {"scenes": storyboard_gen_result}
-    image_gen_result = await image_gen_node.process(image_gen_input)
-    if image_gen_result is None:
-        raise ValueError("Image Generation Agent returned None")
     results[image_gen_node.agent.name] = image_gen_result
 
-    # Update storyboard with generated images and calculate scene durations
+    # Keep the scenes that have images and size each by its narration in a single pass
+    valid_scenes = []
     total_duration = 0
     for scene, image_result in zip(storyboard_gen_result, image_gen_result):
         if image_result is not None and 'image_path' in image_result:
             scene['image_path'] = image_result['image_path']
             # Calculate scene duration based on word count or use a default duration
-            word_count = len(scene.get('script', '').split())
+            narration = scene.get('narration_text', '').strip()
+            word_count = narration.count(' ') + 1 if narration else 0
             scene['duration'] = max(word_count * 0.5, 3.0)  # Assume 0.5 seconds per word, minimum 3 seconds
             total_duration += scene['duration']
+            valid_scenes.append(scene)
         else:
             logger.warning(f"No image generated for scene {scene.get('number', 'unknown')}")
 
+    if not valid_scenes:
+        raise ValueError("No valid scenes with images remaining")
+
     # Adjust scene durations to match target video length
     target_duration = video_length / 1000  # Convert video_length to seconds
-    duration_factor = target_duration / total_duration
-    for scene in storyboard_gen_result:
-        scene['adjusted_duration'] = scene['duration'] * duration_factor
-    
+    duration_factor = target_duration / total_duration if target_duration else 1.0
     logger.info(f"Target duration: {target_duration} seconds")
     logger.info(f"Total calculated duration: {total_duration} seconds")
     logger.info(f"Duration factor: {duration_factor}")
 
-    # Filter out scenes without images
-    valid_scenes = [scene for scene in storyboard_gen_result if 'image_path' in scene]
-
-    if not valid_scenes:
-        raise ValueError("No valid scenes with images remaining")
-
-    # Log scene information
+    # Scale each scene, log it and collect its voiceover in the same pass
+    audio_files = []
     for i, scene in enumerate(valid_scenes):
+        scene['adjusted_duration'] = scene['duration'] * duration_factor
         logger.info(f"Scene {i}: Duration = {scene['duration']:.2f}s, Adjusted Duration = {scene['adjusted_duration']:.2f}s, Image = {scene['image_path']}")
+        if scene.get('audio_file'):
+            audio_files.append(scene['audio_file'])
 
-    # Proceed to generate voiceover and compile video
-    temp_dir = tempfile.mkdtemp()
+    # The scene voiceovers are already rendered; join them and compile the video
     audio_file = os.path.join(temp_dir, "voiceover.mp3")
-    if not generate_voiceover(valid_scenes, audio_file):
+    if not audio_files:
         raise Exception("Failed to generate voiceover")
+    await concat_audio(audio_files, audio_file, temp_dir)
     
-    output_path = compile_youtube_short(scenes=valid_scenes, audio_file=audio_file)
+    async with context.render_semaphore:
+        output_path = await compile_youtube_short(scenes=valid_scenes, audio_file=audio_file,
+                                                  session=context.session, output_path=output_path)
     if output_path:
         print(f"YouTube Short saved as '{output_path}'")
         results["Output Video Path"] = output_path
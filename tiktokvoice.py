@@ -7,6 +7,7 @@
 # --- MODIFIED VERSION --- #
 
 import base64
+import time
 import requests
 import threading
 
@@ -73,6 +74,13 @@ ENDPOINTS = [
 current_endpoint = 0
 # in one conversion, the text can have a maximum length of 300 characters
 TEXT_BYTE_LIMIT = 300
+# how long a successful availability check is trusted before checking again
+ENDPOINT_CHECK_INTERVAL = 60
+
+# one pooled connection set shared by every conversion, including concurrent ones
+session = requests.Session()
+endpoint_lock = threading.Lock()
+last_endpoint_check = None
 
 
 # create a list by splitting a string, every element has n chars
@@ -97,7 +105,7 @@ def split_string(string: str, chunk_size: int) -> List[str]:
 # checking if the website that provides the service is available
 def get_api_response() -> requests.Response:
     url = f'{ENDPOINTS[current_endpoint].split("/a")[0]}'
-    response = requests.get(url)
+    response = session.get(url)
     return response
 
 
@@ -113,10 +121,32 @@ def generate_audio(text: str, voice: str) -> bytes:
     url = f"{ENDPOINTS[current_endpoint]}"
     headers = {"Content-Type": "application/json"}
     data = {"text": text, "voice": voice}
-    response = requests.post(url, headers=headers, json=data)
+    response = session.post(url, headers=headers, json=data)
     return response.content
 
 
+# checking the service at most once per interval, switching endpoints if needed
+def endpoint_available() -> bool:
+    global current_endpoint, last_endpoint_check
+
+    with endpoint_lock:
+        if last_endpoint_check is not None and time.monotonic() - last_endpoint_check < ENDPOINT_CHECK_INTERVAL:
+            return True
+
+        if get_api_response().status_code == 200:
+            print(colored("[+] TikTok TTS Service available!", "green"))
+        else:
+            current_endpoint = (current_endpoint + 1) % 2
+            if get_api_response().status_code == 200:
+                print(colored("[+] TTS Service available!", "green"))
+            else:
+                print(colored("[-] TTS Service not available and probably temporarily rate limited, try again later..." , "red"))
+                return False
+
+        last_endpoint_check = time.monotonic()
+        return True
+
+
 # creates an text to speech audio file
 def tts(
     text: str,
@@ -125,17 +155,8 @@ def tts(
     play_sound: bool = False,
 ) -> None:
     # checking if the website is available
-    global current_endpoint
-
-    if get_api_response().status_code == 200:
-        print(colored("[+] TikTok TTS Service available!", "green"))
-    else:
-        current_endpoint = (current_endpoint + 1) % 2
-        if get_api_response().status_code == 200:
-            print(colored("[+] TTS Service available!", "green"))
-        else:
-            print(colored("[-] TTS Service not available and probably temporarily rate limited, try again later..." , "red"))
-            return
+    if not endpoint_available():
+        return
 
     # checking if arguments are valid
     if voice == "none":